@@ -0,0 +1,217 @@
+"""Offline benchmark for check_updates_test.py.
+
+Starts a local stand-in for law.go.kr (lawSearch.do / lawService.do) with
+configurable latency, error rates and payload size, then runs the checker in a
+fresh subprocess against N synthetic standards and reports throughput, latency
+percentiles (from the record's meta.perf) and peak RSS.
+
+    python scripts/bench_check_updates_test.py --sizes 10,100 --latency-ms 40 --err-429 0.05
+"""
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import tempfile
+import threading
+import subprocess
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CHECKER = os.path.join(HERE, "check_updates_test.py")
+
+# Child wrapper: run the checker's main() and report its own peak RSS
+CHILD = """
+import json, resource, runpy, sys
+sys.argv = [sys.argv[1]] + sys.argv[2:]
+runpy.run_path(sys.argv[0], run_name="__main__")
+print("BENCH " + json.dumps({"maxrssKb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+
+# ==========================
+# Stand-in server
+# ==========================
+
+def make_handler(cfg: argparse.Namespace) -> Any:
+    rnd = random.Random(cfg.seed)
+    lock = threading.Lock()
+    # Distinct 제N조 so the checker sees one article per line, as in a real 조문내용
+    body_text = "".join(f"제{n}조(목적) 이 기준은 화재안전에 관한 사항을 규정한다.\n"
+                        for n in range(1, max(1, cfg.payload_kb * 1024 // 80) + 1))
+
+    def roll() -> str:
+        with lock:
+            x = rnd.random()
+        for kind, rate in (("429", cfg.err_429), ("502", cfg.err_502), ("empty", cfg.err_empty), ("html", cfg.err_html)):
+            if x < rate:
+                return kind
+            x -= rate
+        return ""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out as separate writes; without TCP_NODELAY keep-alive requests stall on delayed ACK
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def _send(self, status: int, body: bytes, ctype: str, extra: Optional[Dict[str, str]] = None) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (extra or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            u = urllib.parse.urlparse(self.path)
+            q = dict(urllib.parse.parse_qsl(u.query))
+            if cfg.latency_ms:
+                time.sleep(max(0.0, cfg.latency_ms + random.uniform(-cfg.jitter_ms, cfg.jitter_ms)) / 1000.0)
+
+            fault = roll()
+            if fault == "429":
+                return self._send(429, b"", "text/plain", {"Retry-After": "0"})
+            if fault == "502":
+                return self._send(502, b"<html>Bad Gateway</html>", "text/html")
+            if fault == "empty":
+                return self._send(200, b"", "application/json")
+            if fault == "html":
+                return self._send(200, "<html>점검 중</html>".encode("utf-8"), "text/html;charset=UTF-8")
+
+            if u.path.endswith("/lawSearch.do"):
+                query = q.get("query", "")
+                adm_id = hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+                js = {"admrul": [{
+                    "행정규칙일련번호": adm_id,
+                    "행정규칙명": query,
+                    "소관부처명": "소방청",
+                    "행정규칙종류": "고시",
+                    "발령일자": "20260225",
+                }]}
+            elif u.path.endswith("/lawService.do"):
+                js = {"행정규칙": {
+                    "행정규칙명": f"BENCH {q.get('ID')}",
+                    "발령번호": "소방청고시 제2026-1호",
+                    "발령일자": "20260225",
+                    "시행일자": "20260301",
+                    "제개정구분명": "일부개정",
+                    "소관부처명": "소방청",
+                    "조문내용": body_text,
+                    "부칙내용": "부칙",
+                    "별표내용": "",
+                }}
+            else:
+                return self._send(404, b"", "text/plain")
+            self._send(200, json.dumps(js, ensure_ascii=False).encode("utf-8"), "application/json;charset=UTF-8")
+
+    return Handler
+
+
+# ==========================
+# Runs
+# ==========================
+
+def write_standards(workdir: str, n: int) -> None:
+    half = (n + 1) // 2
+    for name, prefix, rng in (("nfpc", "NFPC", range(0, half)), ("nftc", "NFTC", range(half, n))):
+        items = [{"code": f"{prefix} {i}", "title": f"BENCH {prefix} {i}", "query": f"{prefix} {i}", "knd": 3}
+                 for i in rng]
+        with open(os.path.join(workdir, f"standards_{name}_bench.json"), "w", encoding="utf-8") as f:
+            json.dump({"items": items}, f, ensure_ascii=False)
+
+
+def run_once(base_url: str, n: int, cfg: argparse.Namespace) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="lawgo-bench-") as wd:
+        write_standards(wd, n)
+        env = {
+            **os.environ,
+            "LAWGO_OC": "bench",
+            "LAWGO_MOCK": "0",
+            "LAWGO_BASE_URL": base_url,
+            "STANDARDS_NFPC": "standards_nfpc_bench.json",
+            "STANDARDS_NFTC": "standards_nftc_bench.json",
+            "OUTPUT_DATA": "data_bench.json",
+            "OUTPUT_SNAPSHOT": "snapshot_bench.json",
+            "LAWGO_CACHE_DIR": os.path.join(wd, "cache"),
+        }
+        # Unlimited rate unless the caller is benchmarking the limiter itself
+        env.setdefault("LAWGO_RATE_SEARCH", "0")
+        env.setdefault("LAWGO_RATE_SERVICE", "0")
+
+        t0 = time.perf_counter()
+        p = subprocess.run([sys.executable, "-c", CHILD, CHECKER, *cfg.checker_args], cwd=wd, env=env,
+                           capture_output=True, text=True)
+        wall = time.perf_counter() - t0
+        if p.returncode != 0:
+            raise SystemExit(f"checker failed (n={n}):\n{p.stderr[-2000:]}")
+
+        bench = {}
+        for line in p.stdout.splitlines():
+            if line.startswith("BENCH "):
+                bench = json.loads(line[6:])
+        with open(os.path.join(wd, "data_bench.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)["records"][0].get("meta", {})
+
+    perf = meta.get("perf", {})
+    return {
+        "n": n,
+        "wallSeconds": round(wall, 3),
+        "throughput": round(n / wall, 2) if wall > 0 else None,
+        "maxrssKb": bench.get("maxrssKb"),
+        "entry": perf.get("ops", {}).get("entry"),
+        "requests": {k: v for k, v in perf.get("ops", {}).items() if k.startswith("request")},
+        "http": meta.get("http"),
+        "rateLimit": meta.get("rateLimit"),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Benchmark check_updates_test.py against a local law.go.kr stand-in")
+    ap.add_argument("--sizes", default="10,100,1000,10000", help="comma-separated standard counts")
+    ap.add_argument("--latency-ms", type=float, default=50.0)
+    ap.add_argument("--jitter-ms", type=float, default=10.0)
+    ap.add_argument("--payload-kb", type=int, default=16, help="조문내용 size per detail response")
+    ap.add_argument("--err-429", type=float, default=0.0)
+    ap.add_argument("--err-502", type=float, default=0.0)
+    ap.add_argument("--err-empty", type=float, default=0.0)
+    ap.add_argument("--err-html", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", default="", help="also write results to this file")
+    ap.add_argument("checker_args", nargs="*", help="extra args passed to the checker (after --)")
+    return ap.parse_args()
+
+
+def main() -> None:
+    cfg = parse_args()
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(cfg))
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{srv.server_address[1]}"
+
+    results: List[Dict[str, Any]] = []
+    try:
+        for n in [int(x) for x in cfg.sizes.split(",") if x.strip()]:
+            res = run_once(base_url, n, cfg)
+            results.append(res)
+            entry = res["entry"] or {}
+            print(f"n={n:>6}  wall={res['wallSeconds']:>8.2f}s  {res['throughput']:>8} std/s  "
+                  f"entry p50={entry.get('p50')}ms p95={entry.get('p95')}ms max={entry.get('max')}ms  "
+                  f"rss={res['maxrssKb']}KB")
+    finally:
+        srv.shutdown()
+
+    if cfg.json:
+        with open(cfg.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
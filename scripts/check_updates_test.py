@@ -1,13 +1,23 @@
 import os
 import json
+import argparse
+import asyncio
+import gzip
 import hashlib
+import math
 import urllib.parse
 import time
 import random
+import re
+import threading
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, Tuple, Optional, List
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple, Optional, List
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # ==========================
 # Runtime config (TEST)
@@ -18,6 +28,27 @@ TODAY = NOW.strftime("%Y-%m-%d")
 
 OUTPUT_DATA = os.getenv("OUTPUT_DATA", "data_test.json")
 OUTPUT_SNAPSHOT = os.getenv("OUTPUT_SNAPSHOT", "snapshot_test.json")
+# Full run history lives in monthly segments; OUTPUT_DATA only keeps an index + recent records
+OUTPUT_HISTORY = os.getenv("OUTPUT_HISTORY", "history_test")
+INDEX_RECENT = 7
+# code -> resolved admrul ID; LAWGO_REGISTRY_DAYS > 0 skips the search for entries resolved within that many days
+OUTPUT_REGISTRY = os.getenv("OUTPUT_REGISTRY", "registry_test.json")
+REGISTRY_DAYS = int(os.getenv("LAWGO_REGISTRY_DAYS", "0") or "0")
+# Catalog discovery crawl (--discover / LAWGO_DISCOVER=1): state + catalog for resumable, incremental paging
+OUTPUT_DISCOVERY = os.getenv("OUTPUT_DISCOVERY", "discovery_test.json")
+DISCOVER = (os.getenv("LAWGO_DISCOVER", "") or "").strip() == "1"
+DISCOVERY_QUERIES = [q.strip() for q in (os.getenv("LAWGO_DISCOVERY_QUERIES", "") or "화재안전성능기준,화재안전기술기준").split(",") if q.strip()]
+DISCOVERY_TARGET = "admrul"
+DISCOVERY_KND = 3  # 행정규칙 종류: 고시
+DISCOVERY_DISPLAY = 100
+DISCOVERY_MAX_PAGES = 200
+# Completed entries are journaled every CHECKPOINT_EVERY standards; a same-day rerun resumes from it
+OUTPUT_JOURNAL = os.getenv("OUTPUT_JOURNAL", "journal_test.jsonl")
+CHECKPOINT_EVERY = int(os.getenv("LAWGO_CHECKPOINT_EVERY", "50") or "50")
+# Content-addressed, gzip-compressed rule bodies (조문/부칙/별표) for computing diffs
+OUTPUT_BLOBS = os.getenv("OUTPUT_BLOBS", "blobs_test")
+# Partial results of sharded runs (--shard-index/--shard-count), combined by --merge
+OUTPUT_SHARDS = os.getenv("OUTPUT_SHARDS", "shards_test")
 
 # Default to test standards files to avoid touching production lists
 STANDARDS_NFPC = os.getenv("STANDARDS_NFPC", "standards_nfpc_test.json")
@@ -25,13 +56,58 @@ STANDARDS_NFTC = os.getenv("STANDARDS_NFTC", "standards_nftc_test.json")
 
 LAWGO_OC = (os.getenv("LAWGO_OC", "") or "").strip()
 MOCK = (os.getenv("LAWGO_MOCK", "") or "").strip() == "1"
+# Async transport (httpx.AsyncClient) instead of the pooled requests.Session
+ASYNC = (os.getenv("LAWGO_ASYNC", "") or "").strip() == "1"
 
-LAW_SEARCH = "https://www.law.go.kr/DRF/lawSearch.do"
-LAW_SERVICE = "https://www.law.go.kr/DRF/lawService.do"
+# Overridable so benchmarks can point at a local stand-in server
+LAWGO_BASE_URL = (os.getenv("LAWGO_BASE_URL", "") or "https://www.law.go.kr").rstrip("/")
+LAW_SEARCH = f"{LAWGO_BASE_URL}/DRF/lawSearch.do"
+LAW_SERVICE = f"{LAWGO_BASE_URL}/DRF/lawService.do"
 
 TIMEOUT = 30
 MAX_RETRIES = 4
 
+# Incremental mode: skip lawgo_detail when search metadata matches the snapshot,
+# but re-verify body hashes at least every FULL_REFRESH_DAYS days
+INCREMENTAL = (os.getenv("LAWGO_INCREMENTAL", "") or "").strip() == "1"
+FULL_REFRESH_DAYS = int(os.getenv("LAWGO_FULL_REFRESH_DAYS", "7") or "7")
+
+# On-disk response cache (successful JSON bodies only); --no-cache / --refresh override
+CACHE_DIR = os.getenv("LAWGO_CACHE_DIR", ".cache/lawgo")
+CACHE_TTL = int(os.getenv("LAWGO_CACHE_TTL", "21600") or "21600")  # seconds
+CACHE_MAX_BYTES = int(os.getenv("LAWGO_CACHE_MAX_MB", "64") or "64") * 1024 * 1024
+CACHE_ENABLED = (os.getenv("LAWGO_CACHE", "1") or "").strip() != "0"
+CACHE_REFRESH = False
+
+# Token-bucket limits per DRF endpoint (requests/second, burst size)
+RATE_SEARCH = float(os.getenv("LAWGO_RATE_SEARCH", "5") or "5")
+RATE_SERVICE = float(os.getenv("LAWGO_RATE_SERVICE", "5") or "5")
+RATE_BURST = max(1, int(os.getenv("LAWGO_RATE_BURST", "5") or "5"))
+RETRY_AFTER_MAX = 120
+
+# Per-endpoint circuit breaker: opens after N consecutive outage failures (0 = off), probes again after a cooldown
+BREAKER_FAILURES = int(os.getenv("LAWGO_BREAKER_FAILURES", "5") or "5")
+BREAKER_COOLDOWN = float(os.getenv("LAWGO_BREAKER_COOLDOWN", "30") or "30")
+
+# Optional JSONL trace of every timed operation (request/search/detail/entry/save)
+TRACE_PATH = (os.getenv("LAWGO_TRACE", "") or "").strip()
+
+# Search-hit scoring weights; defaults reproduce the original org/고시/date scoring (JSON override)
+SCORE_WEIGHTS = {"org": 100.0, "notice": 20.0, "date": 1.0, "recency": 0.0, "title": 0.0,
+                 **json.loads(os.getenv("LAWGO_SCORE_WEIGHTS", "") or "{}")}
+
+# Max standards checked in flight at once (1 = serial)
+CONCURRENCY = max(1, int(os.getenv("LAWGO_CONCURRENCY", "4") or "4"))
+
+# Wall-clock budget for one run in seconds (0 = unlimited); standards not reached in time are deferred
+BUDGET_SECONDS = float(os.getenv("LAWGO_BUDGET_SECONDS", "0") or "0")
+# Per-standard check cadence: each standard is checked every TIER_DAYS[tier] days on a hash-assigned slot
+CADENCE = (os.getenv("LAWGO_CADENCE", "") or "").strip() == "1"
+TIER_DAYS = {"hot": 1, "warm": 7, "cold": 30, **json.loads(os.getenv("LAWGO_TIER_DAYS", "") or "{}")}
+# Check-order priority weights (JSON override); see priority()
+PRIORITY_WEIGHTS = {"new": 10.0, "error": 3.0, "stale": 1.0, "recent": 1.0, "effective": 2.0,
+                    **json.loads(os.getenv("LAWGO_PRIORITY_WEIGHTS", "") or "{}")}
+
 # ==========================
 # Utilities
 # ==========================
@@ -44,9 +120,47 @@ def load(path: str, default: Any) -> Any:
         return default
 
 
-def save(path: str, obj: Any) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+def write_atomic(path: str, raw: bytes) -> None:
+    """Write via temp file + fsync + rename so readers never see a truncated file."""
+    d = os.path.dirname(os.path.abspath(path))
+    tmp = os.path.join(d, f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    try:
+        fd = os.open(d, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def save(path: str, obj: Any) -> bool:
+    """Serialize and write atomically; returns False (no write) when the bytes are unchanged."""
+    with timed("save", path=path) as ev:
+        raw = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        try:
+            with open(path, "rb") as f:
+                if f.read() == raw:
+                    ev["skipped"] = True
+                    return False
+        except FileNotFoundError:
+            pass
+        write_atomic(path, raw)
+        return True
 
 
 def ymd_int_to_dot(v: Any) -> Any:
@@ -62,16 +176,127 @@ def sha256_text(t: str) -> str:
     return hashlib.sha256((t or "").encode("utf-8")).hexdigest()
 
 
-def backoff(attempt: int) -> None:
+_HASH_CHUNK = 1 << 16
+
+
+def sha256_stream(parts: Iterable[Optional[str]]) -> str:
+    """sha256 of the concatenated parts, encoded chunk by chunk (== sha256_text("".join(parts)))."""
+    h = hashlib.sha256()
+    for t in parts:
+        t = t or ""
+        for i in range(0, len(t), _HASH_CHUNK):
+            h.update(t[i:i + _HASH_CHUNK].encode("utf-8"))
+    return h.hexdigest()
+
+
+def _backoff_delay(attempt: int) -> float:
     base = 0.6 * (2 ** (attempt - 1))
-    time.sleep(base + random.random() * 0.4)
+    return base + random.random() * 0.4
+
+
+def backoff(attempt: int) -> None:
+    time.sleep(_backoff_delay(attempt))
+
+
+async def backoff_async(attempt: int) -> None:
+    await asyncio.sleep(_backoff_delay(attempt))
+
+
+# ==========================
+# Timing instrumentation
+# ==========================
+
+_PERF: List[Dict[str, Any]] = []
+_PERF_LOCK = threading.Lock()
+
+
+@contextmanager
+def timed(op: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+    """Record wall-clock time of a block; the yielded dict takes extra fields (attempts, bytes, ...)."""
+    ev: Dict[str, Any] = {"op": op, **fields}
+    t0 = time.perf_counter()
+    try:
+        yield ev
+    finally:
+        ev["ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        with _PERF_LOCK:
+            _PERF.append(ev)
+
+
+def perf_event(op: str, ms: float, **fields: Any) -> None:
+    """Record an already-measured duration (e.g. one standard's share of a batched stage)."""
+    with _PERF_LOCK:
+        _PERF.append({"op": op, **fields, "ms": round(ms, 2)})
+
+
+def _note_retry(ev: Dict[str, Any], err: Dict[str, Any]) -> None:
+    reason = err.get("kind") or "error"
+    if err.get("status") not in (None, 200):
+        reason = f"{reason}:{err.get('status')}"
+    ev.setdefault("retries", []).append(reason)
+
+
+def _percentile(sorted_ms: List[float], q: float) -> float:
+    if not sorted_ms:
+        return 0.0
+    # nearest-rank
+    return sorted_ms[max(0, math.ceil(q * len(sorted_ms)) - 1)]
+
+
+def perf_report(total_seconds: float, slowest: int = 5) -> Dict[str, Any]:
+    """Summarise timed events: p50/p95/max per op (requests split by endpoint) and the slowest standards."""
+    with _PERF_LOCK:
+        events = list(_PERF)
+
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for ev in events:
+        key = f"{ev['op']}:{ev['endpoint']}" if ev.get("endpoint") else ev["op"]
+        groups.setdefault(key, []).append(ev)
+
+    ops: Dict[str, Any] = {}
+    for key in sorted(groups):
+        evs = groups[key]
+        ms = sorted(ev["ms"] for ev in evs)
+        st: Dict[str, Any] = {
+            "count": len(ms),
+            "p50": _percentile(ms, 0.50),
+            "p95": _percentile(ms, 0.95),
+            "max": ms[-1],
+            "totalMs": round(sum(ms), 2),
+        }
+        if key.startswith("request"):
+            reasons: Dict[str, int] = {}
+            for ev in evs:
+                for r in ev.get("retries", []):
+                    reasons[r] = reasons.get(r, 0) + 1
+            st["attempts"] = sum(ev.get("attempts", 0) for ev in evs)
+            st["bytes"] = sum(ev.get("bytes", 0) for ev in evs)
+            st["cached"] = sum(1 for ev in evs if ev.get("cached"))
+            st["retries"] = reasons
+        ops[key] = st
+
+    entries = sorted((ev for ev in events if ev["op"] == "entry" and ev.get("code")),
+                     key=lambda ev: -ev["ms"])
+    return {
+        "totalSeconds": round(total_seconds, 3),
+        "ops": ops,
+        "slowest": [{"code": ev.get("code"), "ms": ev["ms"]} for ev in entries[:slowest]],
+    }
+
+
+def write_trace(path: str) -> None:
+    with _PERF_LOCK:
+        events = list(_PERF)
+    with open(path, "w", encoding="utf-8") as f:
+        for ev in events:
+            f.write(json.dumps(ev, ensure_ascii=False) + "\n")
 
 
 # ==========================
 # HTTP / API wrappers
 # ==========================
 
-def _safe_json_response(r: requests.Response, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+def _safe_json_response(r: Any, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
     ct = (r.headers.get("Content-Type") or "").lower()
     text = r.text or ""
     head = text[:200].replace("\n", " ")
@@ -116,87 +341,673 @@ def _safe_json_response(r: requests.Response, url: str) -> Tuple[Optional[Dict[s
         }
 
 
+# One keep-alive session per process, shared by every worker thread
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+_HTTP_STATS = {"requests": 0}
+_RUN_STATS = {"detailSkipped": 0, "coalesced": 0, "registryReused": 0, "registryReresolved": 0, "deferred": 0}
+_STATS_LOCK = threading.Lock()
+
+
+def _bump(stats: Dict[str, int], key: str, n: int = 1) -> None:
+    with _STATS_LOCK:
+        stats[key] = stats.get(key, 0) + n
+
+
+def get_session() -> requests.Session:
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            s = requests.Session()
+            # Pool sized to the run's concurrency so workers never wait on / discard connections
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(CONCURRENCY, 1))
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _SESSION = s
+        return _SESSION
+
+
+def close_session() -> None:
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+
+def http_stats() -> Dict[str, Any]:
+    """Requests sent vs. TCP/TLS connections opened on the shared session."""
+    if ASYNC:
+        # httpx does not expose per-pool counters; the pool is capped at CONCURRENCY
+        return {"requests": _HTTP_STATS["requests"], "maxConnections": CONCURRENCY}
+    opened = 0
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            for adapter in set(_SESSION.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is not None:
+                        opened += getattr(pool, "num_connections", 0)
+        sent = _HTTP_STATS["requests"]
+    return {"requests": sent, "connections": opened, "reused": max(sent - opened, 0)}
+
+
+# ==========================
+# Rate limiting
+# ==========================
+
+_RATE_STATS: Dict[str, Any] = {"waits": 0, "waitSeconds": 0.0, "throttled": 0, "retryAfter": 0}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; a reservation may drive tokens negative so callers queue fairly."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.stamp = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            if self.rate <= 0:
+                # Unlimited rate, but a server-sent Retry-After still holds
+                return max(0.0, self.paused_until - now)
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= 1.0
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(delay, self.paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller of this endpoint for `seconds` (server-sent Retry-After)."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+_BUCKETS = {
+    "search": TokenBucket(RATE_SEARCH, RATE_BURST),
+    "service": TokenBucket(RATE_SERVICE, RATE_BURST),
+}
+
+
+def _endpoint(url: str) -> str:
+    return "search" if url == LAW_SEARCH else "service"
+
+
+def _bucket(url: str) -> TokenBucket:
+    return _BUCKETS[_endpoint(url)]
+
+
+def _record_wait(delay: float) -> None:
+    if delay > 0:
+        _bump(_RATE_STATS, "waits")
+        _bump(_RATE_STATS, "waitSeconds", delay)
+
+
+def _wait_within_budget(url: str) -> Optional[float]:
+    """Reserve a token; None when the wait (e.g. a Retry-After pause) would run past the run deadline."""
+    delay = _bucket(url).reserve()
+    if delay > 0 and _DEADLINE is not None and time.perf_counter() + delay >= _DEADLINE:
+        return None
+    _record_wait(delay)
+    return delay
+
+
+def rate_wait(url: str) -> bool:
+    delay = _wait_within_budget(url)
+    if delay is None:
+        return False
+    if delay > 0:
+        time.sleep(delay)
+    return True
+
+
+async def rate_wait_async(url: str) -> bool:
+    delay = _wait_within_budget(url)
+    if delay is None:
+        return False
+    if delay > 0:
+        await asyncio.sleep(delay)
+    return True
+
+
+def _retry_after(r: Any) -> Optional[float]:
+    v = (r.headers.get("Retry-After") or "").strip()
+    if not v:
+        return None
+    try:
+        sec = float(v)
+    except ValueError:
+        try:
+            sec = (parsedate_to_datetime(v) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(sec, 0.0), RETRY_AFTER_MAX)
+
+
+def _throttled(url: str, r: Any, err: Dict[str, Any]) -> bool:
+    """Apply a 429/503 Retry-After to the endpoint bucket; True if the next attempt should skip backoff."""
+    if err.get("status") not in (429, 503):
+        return False
+    _bump(_RATE_STATS, "throttled")
+    ra = _retry_after(r)
+    if ra is None:
+        return False
+    _bump(_RATE_STATS, "retryAfter")
+    _bucket(url).pause(ra)
+    return True
+
+
+def rate_meta() -> Dict[str, Any]:
+    return {
+        "search": RATE_SEARCH,
+        "service": RATE_SERVICE,
+        "burst": RATE_BURST,
+        **_RATE_STATS,
+        "waitSeconds": round(_RATE_STATS["waitSeconds"], 3),
+    }
+
+
+# ==========================
+# Circuit breaker
+# ==========================
+
+_BREAKER_STATS: Dict[str, Any] = {"opened": 0, "rejected": 0, "probes": 0}
+
+
+class CircuitBreaker:
+    """closed -> open after `failures` consecutive outage errors; open rejects calls until `cooldown` has
+    passed, then lets a single half-open probe through: success closes it, failure reopens it."""
+
+    def __init__(self, failures: int, cooldown: float) -> None:
+        self.failures = failures
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.count = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if self.failures <= 0:
+            return True
+        with self.lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = "half_open"
+            if self.state == "half_open" and not self.probing:
+                self.probing = True
+                _bump(_BREAKER_STATS, "probes")
+                return True
+            _bump(_BREAKER_STATS, "rejected")
+            return False
+
+    def release(self) -> None:
+        """Give back a half-open probe that was granted but never sent."""
+        with self.lock:
+            self.probing = False
+
+    def success(self) -> None:
+        with self.lock:
+            self.state, self.count, self.probing = "closed", 0, False
+
+    def failure(self) -> None:
+        if self.failures <= 0:
+            return
+        with self.lock:
+            self.count += 1
+            if self.state == "half_open" or (self.state == "closed" and self.count >= self.failures):
+                self.state, self.opened_at, self.probing = "open", time.monotonic(), False
+                _bump(_BREAKER_STATS, "opened")
+
+    def closed(self) -> bool:
+        return self.state == "closed"
+
+
+_BREAKERS = {
+    "search": CircuitBreaker(BREAKER_FAILURES, BREAKER_COOLDOWN),
+    "service": CircuitBreaker(BREAKER_FAILURES, BREAKER_COOLDOWN),
+}
+
+
+def _is_outage(err: Dict[str, Any]) -> bool:
+    """Errors that say the endpoint itself is down (429 is throttling and is left to the rate limiter)."""
+    return err.get("status") in (500, 502, 503, 504) or err.get("kind") in (
+        "request_exception", "empty_body", "not_json", "json_parse_fail")
+
+
+def _breaker_note(url: str, err: Optional[Dict[str, Any]]) -> bool:
+    """Record an attempt's outcome; True when the breaker is (now) not closed, so retrying is pointless."""
+    br = _BREAKERS[_endpoint(url)]
+    if err is not None and _is_outage(err):
+        br.failure()
+    else:
+        br.success()
+    return not br.closed()
+
+
+def _circuit_open(url: str, last_err: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"kind": "circuit_open", "url": url, "endpoint": _endpoint(url),
+            "cause": (last_err or {}).get("kind")}
+
+
+def breaker_meta() -> Dict[str, Any]:
+    return {
+        "failures": BREAKER_FAILURES,
+        "cooldown": BREAKER_COOLDOWN,
+        **_BREAKER_STATS,
+        "state": {name: br.state for name, br in _BREAKERS.items()},
+    }
+
+
+# ==========================
+# Response cache
+# ==========================
+
+_CACHE_STATS = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+_CACHE_LOCK = threading.Lock()
+_CACHE_BYTES: Optional[int] = None
+
+
+def _cache_key(url: str, params: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+    # OC identifies the caller, not the resource
+    norm = {k: str(v) for k, v in sorted(params.items()) if k != "OC"}
+    return hashlib.sha256(f"{url}?{urllib.parse.urlencode(norm)}".encode("utf-8")).hexdigest(), norm
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, key[:2], key + ".json")
+
+
+def cache_get(url: str, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    if not CACHE_ENABLED or CACHE_REFRESH:
+        return None
+    key, _ = _cache_key(url, params)
+    path = _cache_path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            ent = json.load(f)
+        body = ent.get("body") or ""
+        if time.time() - float(ent.get("fetchedAt", 0)) > CACHE_TTL or sha256_text(body) != ent.get("sha256"):
+            raise ValueError("stale or corrupt cache entry")
+        js = json.loads(body)
+    except FileNotFoundError:
+        _bump(_CACHE_STATS, "misses")
+        return None
+    except (OSError, ValueError):
+        _bump(_CACHE_STATS, "misses")
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    try:
+        os.utime(path)  # LRU: mtime is last use
+    except OSError:
+        pass  # evicted by a concurrent cache_put; the body is already read
+    _bump(_CACHE_STATS, "hits")
+    return js
+
+
+def cache_put(url: str, params: Dict[str, str], body: str, headers: Any) -> None:
+    global _CACHE_BYTES
+    if not CACHE_ENABLED:
+        return
+    key, norm = _cache_key(url, params)
+    path = _cache_path(key)
+    ent = {
+        "url": url,
+        "params": norm,
+        "headers": dict(headers or {}),
+        "fetchedAt": time.time(),
+        "sha256": sha256_text(body),
+        "body": body,
+    }
+    raw = json.dumps(ent, ensure_ascii=False).encode("utf-8")
+    try:
+        old_size = os.path.getsize(path)  # overwritten under --refresh or after expiry
+    except OSError:
+        old_size = 0
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_atomic(path, raw)
+    except OSError:
+        return
+    _bump(_CACHE_STATS, "stores")
+
+    with _CACHE_LOCK:
+        if _CACHE_BYTES is None:
+            _CACHE_BYTES = sum(sz for _, _, sz in _cache_files())
+        else:
+            _CACHE_BYTES += len(raw) - old_size
+        if _CACHE_BYTES > CACHE_MAX_BYTES:
+            _CACHE_BYTES = _cache_evict(CACHE_MAX_BYTES * 3 // 4)
+
+
+def _cache_files() -> List[Tuple[float, str, int]]:
+    out = []
+    for root, _, files in os.walk(CACHE_DIR):
+        for fn in files:
+            if fn.endswith(".json"):
+                p = os.path.join(root, fn)
+                try:
+                    st = os.stat(p)
+                except OSError:
+                    continue
+                out.append((st.st_mtime, p, st.st_size))
+    return out
+
+
+def _cache_evict(target: int) -> int:
+    """Drop least recently used entries until the cache is under `target` bytes."""
+    files = sorted(_cache_files())
+    total = sum(sz for _, _, sz in files)
+    for _, p, sz in files:
+        if total <= target:
+            break
+        try:
+            os.remove(p)
+        except OSError:
+            continue
+        total -= sz
+        _bump(_CACHE_STATS, "evictions")
+    return total
+
+
+def cache_meta() -> Dict[str, Any]:
+    return {"enabled": CACHE_ENABLED, "refresh": CACHE_REFRESH, "ttl": CACHE_TTL, **_CACHE_STATS}
+
+
+def _is_retryable(err: Dict[str, Any]) -> bool:
+    return err.get("status") in (429, 500, 502, 503, 504) or err.get("kind") in ("empty_body", "not_json", "json_parse_fail")
+
+
+def _out_of_budget(url: str, last_err: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Retries abandoned at the run deadline; the standard is deferred rather than reported as an error."""
+    return {"kind": "over_budget", "url": url, "cause": (last_err or {}).get("kind")}
+
+
 def _request_json(url: str, params: Dict[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
     # MOCK mode: never call external API
     if MOCK:
         return None, {"kind": "mock_enabled", "status": 200, "contentType": "mock", "head": "mock", "url": url}
 
-    last_err = None
-    with requests.Session() as s:
+    with timed("request", endpoint=_endpoint(url)) as ev:
+        cached = cache_get(url, params)
+        if cached is not None:
+            ev["cached"] = True
+            return cached, None
+
+        last_err = None
+        s = get_session()
         for attempt in range(1, MAX_RETRIES + 1):
+            if attempt > 1 and over_budget():
+                ev["error"] = "over_budget"
+                return None, _out_of_budget(url, last_err)
+            if not _BREAKERS[_endpoint(url)].allow():
+                ev["error"] = "circuit_open"
+                return None, _circuit_open(url, last_err)
+            ev["attempts"] = attempt
             try:
+                if not rate_wait(url):
+                    _BREAKERS[_endpoint(url)].release()
+                    ev["error"] = "over_budget"
+                    return None, _out_of_budget(url, last_err)
+                _bump(_HTTP_STATS, "requests")
                 r = s.get(url, params=params, timeout=TIMEOUT, allow_redirects=True)
+                ev["bytes"] = ev.get("bytes", 0) + len(r.content)
                 js, err = _safe_json_response(r, url)
+                tripped = _breaker_note(url, err)
 
                 if err is None:
+                    cache_put(url, params, r.text, r.headers)
                     return js, None
 
                 last_err = err
-                # retry-worthy
-                if err.get("status") in (429, 500, 502, 503, 504) or err.get("kind") in ("empty_body", "not_json", "json_parse_fail"):
-                    backoff(attempt)
+                if _is_retryable(err):
+                    _note_retry(ev, err)
+                    if not tripped and not _throttled(url, r, err) and not over_budget():
+                        backoff(attempt)
                     continue
 
+                ev["error"] = err.get("kind")
                 return None, err
 
             except requests.RequestException as e:
                 last_err = {"kind": "request_exception", "url": url, "error": str(e)}
-                backoff(attempt)
+                _note_retry(ev, last_err)
+                if not _breaker_note(url, last_err) and not over_budget():
+                    backoff(attempt)
                 continue
 
-    return None, last_err
+        ev["error"] = (last_err or {}).get("kind")
+        return None, last_err
+
+
+# ==========================
+# Request coalescing (single-flight)
+# ==========================
+
+# Identical search/detail calls within one run share a single request and its result
+_INFLIGHT: Dict[Tuple[Any, ...], Future] = {}
+_INFLIGHT_ASYNC: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+_INFLIGHT_LOCK = threading.Lock()
 
 
-def lawgo_search(query: str, knd: int = 3, display: int = 20) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+def _single_flight(key: Tuple[Any, ...], fn: Any) -> Any:
+    with _INFLIGHT_LOCK:
+        fut = _INFLIGHT.get(key)
+        owner = fut is None
+        if owner:
+            fut = _INFLIGHT[key] = Future()
+    if not owner:
+        _bump(_RUN_STATS, "coalesced")
+        return fut.result()
+
+    try:
+        res = fn()
+    except BaseException as e:
+        _single_flight_done(key)
+        fut.set_exception(e)
+        raise
+    # Only in-flight calls are shared: finished results (multi-MB bodies, transient errors) are not kept
+    _single_flight_done(key)
+    fut.set_result(res)
+    return res
+
+
+def _single_flight_done(key: Tuple[Any, ...]) -> None:
+    with _INFLIGHT_LOCK:
+        _INFLIGHT.pop(key, None)
+
+
+async def _single_flight_async(key: Tuple[Any, ...], coro_fn: Any) -> Any:
+    task = _INFLIGHT_ASYNC.get(key)
+    if task is None:
+        task = _INFLIGHT_ASYNC[key] = asyncio.ensure_future(coro_fn())
+
+        def done(t: "asyncio.Task[Any]") -> None:
+            if _INFLIGHT_ASYNC.get(key) is t:
+                del _INFLIGHT_ASYNC[key]
+        task.add_done_callback(done)
+    else:
+        _bump(_RUN_STATS, "coalesced")
+    return await task
+
+
+_MOCK_SEARCH = {
+    "admrul": [
+        {
+            "행정규칙일련번호": "MOCK-001",
+            "소관부처명": "소방청",
+            "행정규칙종류": "고시",
+            "발령일자": "20260225",
+            "행정규칙상세링크": "https://www.law.go.kr/"
+        }
+    ]
+}
+
+_MOCK_DETAIL = {
+    "행정규칙": {
+        "행정규칙명": "MOCK NFPC/NFTC",
+        "발령번호": "소방청고시 제2026-1호",
+        "발령일자": "20260225",
+        "시행일자": "20260301",
+        "제개정구분명": "일부개정",
+        "소관부처명": "소방청",
+        "조문내용": "제1조(목적) ... (mock)",
+        "부칙내용": "부칙 ... (mock)",
+        "별표내용": ""
+    }
+}
+
+
+def lawgo_search(query: str, knd: int = 3, display: int = 20, page: int = 1,
+                 target: str = "admrul") -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    src = ADAPTERS[target]
     if MOCK:
         # Minimal mock search result
-        return {
-            "admrul": [
-                {
-                    "행정규칙일련번호": "MOCK-001",
-                    "소관부처명": "소방청",
-                    "행정규칙종류": "고시",
-                    "발령일자": "20260225",
-                    "행정규칙상세링크": "https://www.law.go.kr/"
-                }
-            ]
-        }, None
-
-    params = {
-        "OC": LAWGO_OC,
-        "target": "admrul",
-        "type": "JSON",
-        "query": query,
-        "knd": str(knd),
-        "display": str(display),
-        "sort": "ddes",
-    }
-    return _request_json(LAW_SEARCH, params)
+        return (src.mock_search if page == 1 else {}), None
+    with timed("search", query=query, page=page):
+        return _single_flight(("search", target, query, knd, display, page),
+                              lambda: _request_json(LAW_SEARCH, src.search_params(query, knd, display, page)))
+
+
+def lawgo_search_pages(query: str, knd: int = 3, display: int = 100, max_pages: int = 10,
+                       target: str = "admrul", start: int = 1, window: int = 1
+                       ) -> Iterator[Tuple[int, List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    """Yield (page, hits, err) in page order from `start`, fetching `window` pages concurrently.
+
+    Stops after the first error, a short page, totalCnt or max_pages; a caller that breaks out early
+    skips the windows not yet fetched. Past the run deadline the next window yields an over_budget error.
+    """
+    src = ADAPTERS[target]
+    seen = (start - 1) * display
+    page = start
+    while page <= max_pages:
+        if over_budget():
+            yield page, [], {"kind": "over_budget"}
+            return
+        pages = list(range(page, min(page + max(window, 1), max_pages + 1)))
+        fetch = lambda p: lawgo_search(query, knd=knd, display=display, page=p, target=target)  # noqa: E731
+        if len(pages) > 1:
+            with ThreadPoolExecutor(max_workers=len(pages)) as ex:
+                res = list(ex.map(fetch, pages))
+        else:
+            res = [fetch(page)]
+
+        for p, (js, err) in zip(pages, res):
+            if err:
+                yield p, [], err
+                return
+            hits = src.extract_items(js or {})
+            seen += len(hits)
+            yield p, hits, None
+            total = _search_total(js or {})
+            if len(hits) < display or (total is not None and seen >= total):
+                return
+        page = pages[-1] + 1
+
+
+def lawgo_detail(admrul_id: str, target: str = "admrul") -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    src = ADAPTERS[target]
+    if MOCK:
+        return src.mock_detail, None
+    with timed("detail", id=str(admrul_id)):
+        return _single_flight(("detail", target, str(admrul_id)),
+                              lambda: _request_json(LAW_SERVICE, src.detail_params(admrul_id)))
 
 
-def lawgo_detail(admrul_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+# ==========================
+# Async transport (LAWGO_ASYNC=1)
+# ==========================
+
+# Created by run_checks_async for the lifetime of one event loop
+_ASYNC_CLIENT: Any = None
+
+
+async def _request_json_async(url: str, params: Dict[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
     if MOCK:
-        return {
-            "행정규칙": {
-                "행정규칙명": "MOCK NFPC/NFTC",
-                "발령번호": "소방청고시 제2026-1호",
-                "발령일자": "20260225",
-                "시행일자": "20260301",
-                "제개정구분명": "일부개정",
-                "소관부처명": "소방청",
-                "조문내용": "제1조(목적) ... (mock)",
-                "부칙내용": "부칙 ... (mock)",
-                "별표내용": ""
-            }
-        }, None
+        return None, {"kind": "mock_enabled", "status": 200, "contentType": "mock", "head": "mock", "url": url}
 
-    params = {
-        "OC": LAWGO_OC,
-        "target": "admrul",
-        "type": "JSON",
-        "ID": str(admrul_id),
-    }
-    return _request_json(LAW_SERVICE, params)
+    import httpx
+
+    with timed("request", endpoint=_endpoint(url)) as ev:
+        cached = cache_get(url, params)
+        if cached is not None:
+            ev["cached"] = True
+            return cached, None
+
+        last_err = None
+        for attempt in range(1, MAX_RETRIES + 1):
+            if attempt > 1 and over_budget():
+                ev["error"] = "over_budget"
+                return None, _out_of_budget(url, last_err)
+            if not _BREAKERS[_endpoint(url)].allow():
+                ev["error"] = "circuit_open"
+                return None, _circuit_open(url, last_err)
+            ev["attempts"] = attempt
+            try:
+                if not await rate_wait_async(url):
+                    _BREAKERS[_endpoint(url)].release()
+                    ev["error"] = "over_budget"
+                    return None, _out_of_budget(url, last_err)
+                _bump(_HTTP_STATS, "requests")
+                r = await _ASYNC_CLIENT.get(url, params=params, timeout=TIMEOUT, follow_redirects=True)
+                ev["bytes"] = ev.get("bytes", 0) + len(r.content)
+                js, err = _safe_json_response(r, url)
+                tripped = _breaker_note(url, err)
+
+                if err is None:
+                    cache_put(url, params, r.text, r.headers)
+                    return js, None
+
+                last_err = err
+                if _is_retryable(err):
+                    _note_retry(ev, err)
+                    if not tripped and not _throttled(url, r, err) and not over_budget():
+                        await backoff_async(attempt)
+                    continue
+
+                ev["error"] = err.get("kind")
+                return None, err
+
+            except httpx.HTTPError as e:
+                last_err = {"kind": "request_exception", "url": url, "error": str(e)}
+                _note_retry(ev, last_err)
+                if not _breaker_note(url, last_err) and not over_budget():
+                    await backoff_async(attempt)
+                continue
+
+        ev["error"] = (last_err or {}).get("kind")
+        return None, last_err
+
+
+async def lawgo_search_async(query: str, knd: int = 3, display: int = 20,
+                             target: str = "admrul") -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    src = ADAPTERS[target]
+    if MOCK:
+        return src.mock_search, None
+    with timed("search", query=query):
+        return await _single_flight_async(("search", target, query, knd, display),
+                                          lambda: _request_json_async(LAW_SEARCH, src.search_params(query, knd, display)))
+
+
+async def lawgo_detail_async(admrul_id: str, target: str = "admrul") -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    src = ADAPTERS[target]
+    if MOCK:
+        return src.mock_detail, None
+    with timed("detail", id=str(admrul_id)):
+        return await _single_flight_async(("detail", target, str(admrul_id)),
+                                          lambda: _request_json_async(LAW_SERVICE, src.detail_params(admrul_id)))
 
 
 # ==========================
@@ -204,6 +1015,8 @@ def lawgo_detail(admrul_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dic
 # ==========================
 
 def _extract_items(search_json: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if isinstance(search_json.get("AdmRulSearch"), dict):
+        search_json = search_json["AdmRulSearch"]
     for k in ("admrul", "Admrul", "admruls"):
         if k in search_json:
             v = search_json.get(k)
@@ -213,6 +1026,15 @@ def _extract_items(search_json: Dict[str, Any]) -> List[Dict[str, Any]]:
     return []
 
 
+def _search_total(search_json: Dict[str, Any]) -> Optional[int]:
+    if isinstance(search_json.get("AdmRulSearch"), dict):
+        search_json = search_json["AdmRulSearch"]
+    try:
+        return int(search_json.get("totalCnt"))
+    except (TypeError, ValueError):
+        return None
+
+
 def _extract_payload(detail_json: Dict[str, Any]) -> Dict[str, Any]:
     if isinstance(detail_json.get("행정규칙"), dict):
         return detail_json["행정규칙"]
@@ -221,67 +1043,726 @@ def _extract_payload(detail_json: Dict[str, Any]) -> Dict[str, Any]:
     return detail_json
 
 
-def pick_best_item(items: List[Dict[str, Any]], org_name: str = "소방청") -> Optional[Dict[str, Any]]:
-    best = None
-    best_score = -1
-    for it in items or []:
-        org = (it.get("소관부처명") or it.get("소관부처") or "")
-        kind = (it.get("행정규칙종류") or "")
-        score = 0
-        if org_name and org_name in org:
-            score += 100
-        if "고시" in kind:
-            score += 20
-        if it.get("발령일자"):
-            score += 1
-        if score > best_score:
-            best, best_score = it, score
-    return best
-
-
 # ==========================
-# Core build
+# Source adapters (DRF targets)
 # ==========================
 
-def build_snapshot_entry(std_item: Dict[str, Any], tab_key: str, prev_entry: Dict[str, Any]) -> Dict[str, Any]:
-    query = std_item.get("query") or std_item.get("title") or std_item.get("code")
-    knd = int(std_item.get("knd", 3))
-    org_name = std_item.get("orgName", "소방청")
+def _text(v: Any) -> str:
+    """DRF JSON wraps some scalars as {"content": ...}."""
+    if isinstance(v, dict):
+        v = v.get("content")
+    return "" if v is None else str(v)
+
+
+def _collect_text(node: Any) -> str:
+    """Concatenate every *내용 string under a nested 조문/항/호/목 (or 부칙/별표) tree, in document order."""
+    out: List[str] = []
+
+    def walk(n: Any) -> None:
+        if isinstance(n, list):
+            for x in n:
+                walk(x)
+        elif isinstance(n, dict):
+            for k, v in n.items():
+                if k.endswith("내용") and isinstance(v, (str, list)):
+                    if isinstance(v, str):
+                        out.append(v)
+                    else:
+                        walk_strings(v)
+                elif isinstance(v, (dict, list)):
+                    walk(v)
+
+    def walk_strings(v: List[Any]) -> None:
+        # DRF law JSON nests 부칙내용/별표내용 as arrays of arrays of lines
+        for x in v:
+            if isinstance(x, str):
+                out.append(x)
+            elif isinstance(x, list):
+                walk_strings(x)
+            else:
+                walk(x)
+
+    walk(node)
+    return "\n".join(t.strip("\n") for t in out if t)
+
+
+class SourceAdapter:
+    """admrul (행정규칙). Subclasses override request params, extraction and hashed fields per DRF target."""
+
+    target = "admrul"
+    has_detail = True
+    id_fields: Tuple[str, ...] = ("행정규칙일련번호", "일련번호", "id", "ID")
+    # Hit columns used for ranking, incremental checks and the registry
+    hit_fields = {"name": "행정규칙명", "org": "소관부처명", "kind": "행정규칙종류", "date": "발령일자",
+                  "link": "행정규칙상세링크"}
+    body_fields: Tuple[str, ...] = ("조문내용", "부칙내용", "별표내용")
+    mock_search: Dict[str, Any] = _MOCK_SEARCH
+    mock_detail: Dict[str, Any] = _MOCK_DETAIL
+
+    def search_params(self, query: str, knd: int, display: int, page: int = 1) -> Dict[str, str]:
+        params = {
+            "OC": LAWGO_OC,
+            "target": self.target,
+            "type": "JSON",
+            "query": query,
+            "knd": str(knd),
+            "display": str(display),
+            "sort": "ddes",
+        }
+        if page > 1:
+            params["page"] = str(page)
+        return params
+
+    def detail_params(self, doc_id: str) -> Dict[str, str]:
+        return {"OC": LAWGO_OC, "target": self.target, "type": "JSON", "ID": str(doc_id)}
+
+    def extract_items(self, search_json: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return _extract_items(search_json)
+
+    def extract_payload(self, detail_json: Dict[str, Any]) -> Dict[str, Any]:
+        return _extract_payload(detail_json)
+
+    def item_id(self, hit: Dict[str, Any]) -> Optional[str]:
+        for k in self.id_fields:
+            if hit.get(k):
+                return str(hit[k])
+        return None
+
+    def hit(self, it: Dict[str, Any], field: str) -> Any:
+        return it.get(self.hit_fields[field])
 
-    # 1) search
-    search_json, err = lawgo_search(query, knd=knd)
-    if err:
+    def meta(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
-            **(prev_entry or {}),
-            "code": std_item.get("code"),
-            "title": std_item.get("title"),
-            "checkedAt": TODAY,
-            "error": {"where": "search", **err, "query": query},
+            "noticeNo": payload.get("발령번호"),
+            "announceDate": ymd_int_to_dot(payload.get("발령일자")),
+            "effectiveDate": ymd_int_to_dot(payload.get("시행일자")),
+            "revisionType": payload.get("제개정구분명"),
+            "orgName": payload.get("소관부처명"),
+            "ruleName": payload.get("행정규칙명"),
         }
 
-    items = _extract_items(search_json or {})
-    best = pick_best_item(items, org_name=org_name)
-    if not best:
+    def texts(self, payload: Dict[str, Any]) -> Dict[str, str]:
+        """{field: text} for body_fields; the first field is the body (article hashes, diffs), the rest supplementary."""
+        return {f: payload.get(f) or "" for f in self.body_fields}
+
+    def found(self, payload: Dict[str, Any]) -> bool:
+        return bool(payload.get("행정규칙명") or payload.get("조문내용"))
+
+    def html_url(self, best: Dict[str, Any], doc_id: str) -> str:
+        url = self.hit(best, "link") or best.get("상세링크") or ""
+        if not url:
+            # DRF HTML (clickable) - safe for users
+            url = f"{LAW_SERVICE}?OC={urllib.parse.quote(LAWGO_OC)}&target={self.target}&ID={doc_id}&type=HTML"
+        return url
+
+
+class LawAdapter(SourceAdapter):
+    """law (법령 본문): articles arrive as a 조문단위 tree, keyed by 법령일련번호 (MST)."""
+
+    target = "law"
+    id_fields = ("법령일련번호", "MST", "법령ID")
+    hit_fields = {"name": "법령명한글", "org": "소관부처명", "kind": "법령구분명", "date": "공포일자",
+                  "link": "법령상세링크"}
+    body_fields = ("조문", "부칙", "별표")
+    mock_search = {"law": [{
+        "법령일련번호": "MOCK-LAW-1",
+        "법령명한글": "MOCK 화재의 예방 및 안전관리에 관한 법률",
+        "소관부처명": "소방청",
+        "법령구분명": "법률",
+        "공포일자": "20260225",
+    }]}
+    mock_detail = {"법령": {
+        "기본정보": {
+            "법령명_한글": "MOCK 화재의 예방 및 안전관리에 관한 법률",
+            "공포번호": "20000",
+            "공포일자": "20260225",
+            "시행일자": "20260301",
+            "제개정구분": "일부개정",
+            "소관부처": {"content": "소방청"},
+        },
+        "조문": {"조문단위": [{"조문내용": "제1조(목적) ... (mock)", "항": [{"항내용": "① ... (mock)"}]}]},
+        "부칙": {"부칙단위": [{"부칙내용": [["부칙 <제20000호,2026.2.25.>", "이 법은 ... 시행한다. (mock)"]]}]},
+    }}
+
+    def search_params(self, query: str, knd: int, display: int, page: int = 1) -> Dict[str, str]:
+        params = super().search_params(query, knd, display, page)
+        params.pop("knd")  # 행정규칙 종류 filter only
+        return params
+
+    def detail_params(self, doc_id: str) -> Dict[str, str]:
+        return {"OC": LAWGO_OC, "target": self.target, "type": "JSON", "MST": str(doc_id)}
+
+    def extract_items(self, search_json: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if isinstance(search_json.get("LawSearch"), dict):
+            search_json = search_json["LawSearch"]
+        v = search_json.get("law")
+        return v if isinstance(v, list) else ([v] if isinstance(v, dict) else [])
+
+    def extract_payload(self, detail_json: Dict[str, Any]) -> Dict[str, Any]:
+        v = detail_json.get("법령")
+        return v if isinstance(v, dict) else detail_json
+
+    def meta(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        info = payload.get("기본정보") or {}
         return {
-            **(prev_entry or {}),
-            "code": std_item.get("code"),
-            "title": std_item.get("title"),
-            "checkedAt": TODAY,
-            "error": {"where": "search", "kind": "no_results", "query": query},
+            "noticeNo": _text(info.get("공포번호")) or None,
+            "announceDate": ymd_int_to_dot(_text(info.get("공포일자"))),
+            "effectiveDate": ymd_int_to_dot(_text(info.get("시행일자"))),
+            "revisionType": _text(info.get("제개정구분")) or None,
+            "orgName": _text(info.get("소관부처")) or None,
+            "ruleName": _text(info.get("법령명_한글")) or None,
         }
 
-    adm_id = best.get("행정규칙일련번호") or best.get("일련번호") or best.get("id") or best.get("ID")
-    if not adm_id:
+    def texts(self, payload: Dict[str, Any]) -> Dict[str, str]:
+        return {f: _collect_text(payload.get(f)) for f in self.body_fields}
+
+    def found(self, payload: Dict[str, Any]) -> bool:
+        return bool(payload.get("기본정보") or payload.get("조문"))
+
+    def html_url(self, best: Dict[str, Any], doc_id: str) -> str:
+        url = self.hit(best, "link") or ""
+        if not url:
+            url = f"{LAW_SERVICE}?OC={urllib.parse.quote(LAWGO_OC)}&target={self.target}&MST={doc_id}&type=HTML"
+        return url
+
+
+class LicBylAdapter(SourceAdapter):
+    """licbyl (법령 별표·서식): the search hit is the whole record, so no detail call is made.
+
+    The hashed "body" is the form's title/number/file link, which changes whenever the 별표 is amended.
+    """
+
+    target = "licbyl"
+    has_detail = False
+    id_fields = ("별표일련번호", "별표서식일련번호")
+    hit_fields = {"name": "별표명", "org": "소관부처명", "kind": "별표종류", "date": "공포일자",
+                  "link": "별표법령상세링크"}
+    body_fields = ("별표", "관련법령")
+    mock_search = {"licbyl": [{
+        "별표일련번호": "MOCK-BYL-1",
+        "별표명": "MOCK 소방시설의 종류",
+        "별표번호": "0001",
+        "별표종류": "별표",
+        "관련법령명": "MOCK 소방시설 설치 및 관리에 관한 법률 시행령",
+        "소관부처명": "소방청",
+        "공포일자": "20260225",
+        "별표서식파일링크": "https://www.law.go.kr/",
+    }]}
+    mock_detail: Dict[str, Any] = {}
+
+    def search_params(self, query: str, knd: int, display: int, page: int = 1) -> Dict[str, str]:
+        params = super().search_params(query, knd, display, page)
+        params.pop("knd")
+        return params
+
+    def extract_items(self, search_json: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if isinstance(search_json.get("licBylSearch"), dict):
+            search_json = search_json["licBylSearch"]
+        v = search_json.get("licbyl")
+        return v if isinstance(v, list) else ([v] if isinstance(v, dict) else [])
+
+    def extract_payload(self, detail_json: Dict[str, Any]) -> Dict[str, Any]:
+        return detail_json
+
+    def meta(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return {
-            **(prev_entry or {}),
-            "code": std_item.get("code"),
-            "title": std_item.get("title"),
-            "checkedAt": TODAY,
-            "error": {"where": "search", "kind": "id_missing", "query": query},
+            "noticeNo": payload.get("공포번호"),
+            "announceDate": ymd_int_to_dot(payload.get("공포일자")),
+            "effectiveDate": ymd_int_to_dot(payload.get("시행일자")),
+            "revisionType": payload.get("제개정구분명"),
+            "orgName": payload.get("소관부처명"),
+            "ruleName": payload.get("별표명"),
+        }
+
+    def texts(self, payload: Dict[str, Any]) -> Dict[str, str]:
+        form = [payload.get(k) for k in ("별표명", "별표번호", "별표종류", "별표서식파일링크", "별표서식PDF파일링크")]
+        return {
+            "별표": "\n".join(str(x) for x in form if x),
+            "관련법령": "\n".join(str(x) for x in (payload.get("관련법령명"), payload.get("관련법령ID")) if x),
         }
 
-    # 2) detail
-    det, derr = lawgo_detail(str(adm_id))
+    def found(self, payload: Dict[str, Any]) -> bool:
+        return bool(payload.get("별표명"))
+
+    def html_url(self, best: Dict[str, Any], doc_id: str) -> str:
+        return self.hit(best, "link") or best.get("별표서식파일링크") or ""
+
+
+ADAPTERS: Dict[str, SourceAdapter] = {a.target: a for a in (SourceAdapter(), LawAdapter(), LicBylAdapter())}
+
+
+def _target(std_item: Dict[str, Any]) -> str:
+    return std_item.get("target") or "admrul"
+
+
+def score_item(it: Dict[str, Any], org_name: str = "소방청", fields: Optional[Dict[str, str]] = None,
+               title: str = "") -> float:
+    ranked = rank_items({0: [it]}, org_name=org_name, titles={0: title} if title else None, top_k=1, fields=fields)[0]
+    return ranked[0][0] if ranked else 0.0
+
+
+def _bigrams(t: str) -> set:
+    t = "".join((t or "").split())
+    return {t[i:i + 2] for i in range(len(t) - 1)} or ({t} if t else set())
+
+
+def rank_items(groups: Dict[Any, List[Dict[str, Any]]], org_name: str = "소방청",
+               titles: Optional[Dict[Any, str]] = None, weights: Optional[Dict[str, float]] = None,
+               top_k: int = 5, fields: Optional[Dict[str, str]] = None) -> Dict[Any, List[Tuple[float, Dict[str, Any]]]]:
+    """Score every hit of every query in one pass over flat columns; top_k (score, item) per group.
+
+    Weights: org (소관부처 match), notice (고시), date (has 발령일자), recency (발령일자 scaled 0..1
+    across all hits), title (bigram Jaccard of 행정규칙명 vs the group's title). Ties keep search order.
+    `fields` maps name/org/kind/date to the hit columns of a non-admrul source (SourceAdapter.hit_fields).
+    """
+    w = {**SCORE_WEIGHTS, **(weights or {})}
+    titles = titles or {}
+    f = fields or SourceAdapter.hit_fields
+
+    # columns
+    gid: List[Any] = []
+    items: List[Dict[str, Any]] = []
+    for g, its in groups.items():
+        for it in its or []:
+            gid.append(g)
+            items.append(it)
+    if not items:
+        return {g: [] for g in groups}
+
+    orgs = [(it.get(f["org"]) or it.get("소관부처") or "") for it in items]
+    kinds = [(it.get(f["kind"]) or "") for it in items]
+    dates = [str(it.get(f["date"]) or "") for it in items]
+    names = [(it.get(f["name"]) or "") for it in items]
+
+    score = [0.0] * len(items)
+    if org_name and w["org"]:
+        score = [sc + (w["org"] if org_name in o else 0.0) for sc, o in zip(score, orgs)]
+    if w["notice"]:
+        score = [sc + (w["notice"] if "고시" in k else 0.0) for sc, k in zip(score, kinds)]
+    if w["date"]:
+        score = [sc + (w["date"] if d else 0.0) for sc, d in zip(score, dates)]
+    if w["recency"]:
+        nums = [int(d) if d.isdigit() else None for d in dates]
+        known = [n for n in nums if n is not None]
+        lo, hi = (min(known), max(known)) if known else (0, 0)
+        span = (hi - lo) or 1
+        score = [sc + (w["recency"] * (n - lo) / span if n is not None else 0.0) for sc, n in zip(score, nums)]
+    if w["title"] and titles:
+        tb = {g: _bigrams(t) for g, t in titles.items()}
+        sims = []
+        for g, nm in zip(gid, names):
+            a, b = tb.get(g) or set(), _bigrams(nm)
+            sims.append(len(a & b) / len(a | b) if a and b else 0.0)
+        score = [sc + w["title"] * x for sc, x in zip(score, sims)]
+
+    order = sorted(range(len(items)), key=lambda i: -score[i])  # stable: ties keep search order
+    out: Dict[Any, List[Tuple[float, Dict[str, Any]]]] = {g: [] for g in groups}
+    for i in order:
+        lst = out[gid[i]]
+        if len(lst) < top_k:
+            lst.append((score[i], items[i]))
+    return out
+
+
+# ==========================
+# Body blobs (content-addressed)
+# ==========================
+
+def _blob_path(sha: str) -> str:
+    return os.path.join(OUTPUT_BLOBS, sha[:2], sha + ".gz")
+
+
+def blob_put(text: Optional[str], sha: Optional[str] = None) -> str:
+    """Store text once under its sha256; identical bodies across standards and runs share one file."""
+    text = text or ""
+    sha = sha or sha256_stream([text])
+    path = _blob_path(sha)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # mtime=0 keeps the compressed bytes stable for git
+        write_atomic(path, gzip.compress(text.encode("utf-8"), mtime=0))
+    return sha
+
+
+def blob_get(sha: Optional[str]) -> Optional[str]:
+    if not sha:
+        return None
+    try:
+        with open(_blob_path(sha), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+    except (OSError, EOFError, UnicodeDecodeError):
+        return None
+
+
+# ==========================
+# Article diff
+# ==========================
+
+# A line that starts an article: 제N조(의M) followed by its (제목), "삭제", a ① 항 or the end of the line.
+# "제2조제1호에도 불구하고", "제5조는", "제5조부터 제7조까지", "제5조 및" are cross-references
+_ARTICLE_RE = re.compile(r"(?m)^[ \t]*(제\d+조(?:의\d+)?)(?=\(|[ \t]*삭제|[ \t]*[①-⑳]|[ \t]*$)(?:\([^)\n]*\))?")
+
+
+def split_articles(text: str) -> List[Tuple[str, str]]:
+    """Split 조문내용 into (key, text) per 제N조; text before the first article is keyed "전문"."""
+    text = text or ""
+    out: List[Tuple[str, str]] = []
+    seen: Dict[str, int] = {}
+    marks = list(_ARTICLE_RE.finditer(text))
+    if not marks or marks[0].start() > 0:
+        head = text[:marks[0].start()] if marks else text
+        if head.strip():
+            out.append(("전문", head))
+    for i, m in enumerate(marks):
+        end = marks[i + 1].start() if i + 1 < len(marks) else len(text)
+        key = m.group(1)
+        seen[key] = seen.get(key, 0) + 1
+        if seen[key] > 1:
+            key = f"{key}#{seen[key]}"
+        out.append((key, text[m.start():end]))
+    return out
+
+
+def _article_title(article: str) -> str:
+    return article.strip().split("\n", 1)[0][:80]
+
+
+def article_diff(old: str, new: str) -> List[Dict[str, Any]]:
+    """Articles added/removed/modified between two bodies, in new-body order (removed ones last)."""
+    old_map = dict(split_articles(old))
+    out: List[Dict[str, Any]] = []
+    new_keys = set()
+    for key, art in split_articles(new):
+        new_keys.add(key)
+        if key not in old_map:
+            out.append({"article": key, "change": "added", "title": _article_title(art)})
+        elif old_map[key] != art:
+            out.append({"article": key, "change": "modified", "title": _article_title(art)})
+    for key, art in old_map.items():
+        if key not in new_keys:
+            out.append({"article": key, "change": "removed", "title": _article_title(art)})
+    return out
+
+
+# ==========================
+# Text diff (Myers, bounded)
+# ==========================
+
+DIFF_CONTEXT = 2
+DIFF_MAX_LINES = 200      # per diff entry; longer output is truncated
+DIFF_MAX_EDITS = 1000     # Myers D bound
+DIFF_STEP_BUDGET = 5_000_000  # diagonal + snake steps actually taken; keeps multi-MB 별표 diffs bounded in time
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+")
+
+
+def _diff_units(text: str) -> List[str]:
+    """Lines, with very long lines (table rows, run-on 조문) further split into sentences."""
+    out: List[str] = []
+    for line in (text or "").split("\n"):
+        out.extend(_SENTENCE_RE.split(line) if len(line) > 200 else [line])
+    return out
+
+
+def myers_diff(a: List[Any], b: List[Any], max_d: int = DIFF_MAX_EDITS,
+               budget: Optional[List[int]] = None) -> Optional[List[Tuple[str, Any]]]:
+    """Shortest edit script as [(" "|"-"|"+", item)], or None if it needs more than max_d edits or more
+    diagonal/snake steps than budget[0] (default DIFF_STEP_BUDGET); steps taken are deducted from budget[0]."""
+    budget = budget if budget is not None else [DIFF_STEP_BUDGET]
+    max_steps = budget[0]
+    n, m = len(a), len(b)
+    max_d = min(max_d, n + m)
+    off = max_d + 1
+    v = [0] * (2 * max_d + 3)
+    trace: List[List[int]] = []
+    steps = 0
+
+    for d in range(max_d + 1):
+        # values from step d-1 for k in [-d-1, d+1]
+        trace.append(v[off - d - 1:off + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[off + k - 1] < v[off + k + 1]):
+                x = v[off + k + 1]
+            else:
+                x = v[off + k - 1] + 1
+            y = x - k
+            x0 = x
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            steps += 1 + x - x0
+            v[off + k] = x
+            if x >= n and y >= m:
+                budget[0] -= steps
+                return _myers_backtrack(a, b, trace, n, m)
+        if steps > max_steps:
+            break
+    budget[0] -= steps
+    return None
+
+
+def _myers_backtrack(a: List[Any], b: List[Any], trace: List[List[int]], x: int, y: int) -> List[Tuple[str, Any]]:
+    ops: List[Tuple[str, Any]] = []
+    for d in range(len(trace) - 1, -1, -1):
+        vp = trace[d]
+        k = x - y
+        if k == -d or (k != d and vp[k - 1 + d + 1] < vp[k + 1 + d + 1]):
+            pk = k + 1
+        else:
+            pk = k - 1
+        px = vp[pk + d + 1]
+        py = px - pk
+        while x > px and y > py:
+            ops.append((" ", a[x - 1]))
+            x -= 1
+            y -= 1
+        if d > 0:
+            if x == px:
+                ops.append(("+", b[y - 1]))
+            else:
+                ops.append(("-", a[x - 1]))
+        x, y = px, py
+    ops.reverse()
+    return ops
+
+
+def _bounded_diff(a: List[Any], b: List[Any], budget: Optional[List[int]] = None
+                  ) -> Tuple[int, Optional[List[Tuple[str, Any]]]]:
+    """Trim common prefix/suffix, then Myers within the step budget. Returns (prefix_len, ops)."""
+    pre = 0
+    while pre < len(a) and pre < len(b) and a[pre] == b[pre]:
+        pre += 1
+    suf = 0
+    while suf < len(a) - pre and suf < len(b) - pre and a[-1 - suf] == b[-1 - suf]:
+        suf += 1
+    a2, b2 = a[pre:len(a) - suf], b[pre:len(b) - suf]
+    ops = myers_diff(a2, b2, budget=budget)
+    if ops is None:
+        return pre, None
+    ctx_a = a[max(0, pre - DIFF_CONTEXT):pre]
+    ctx_b = a[len(a) - suf:len(a) - suf + DIFF_CONTEXT] if suf else []
+    return pre - len(ctx_a), [(" ", x) for x in ctx_a] + ops + [(" ", x) for x in ctx_b]
+
+
+def _inline(old: str, new: str, budget: Optional[List[int]] = None) -> Optional[str]:
+    """Character-level refinement of one replaced line: 정의 [-a-]{+b+}."""
+    pre, ops = _bounded_diff(list(old), list(new), budget)
+    if ops is None:
+        return None
+    out = [old[:pre]]
+    cur_op, buf = " ", []
+    for op, ch in ops + [("", "")]:  # sentinel flushes the last run
+        if op != cur_op:
+            seg = "".join(buf)
+            out.append(seg if cur_op == " " else (f"[-{seg}-]" if cur_op == "-" else f"{{+{seg}+}}"))
+            cur_op, buf = op, []
+        buf.append(ch)
+    return "".join(out) + old[pre + sum(1 for op, _ in ops if op != "+"):]
+
+
+def text_diff(old: str, new: str) -> Dict[str, Any]:
+    """Unified line/sentence diff (context DIFF_CONTEXT) plus inline char-level changes for replaced lines."""
+    a, b = _diff_units(old), _diff_units(new)
+    start, ops = _bounded_diff(a, b)
+    if ops is None:
+        return {"hunks": [f"@@ 변경 범위가 커서 생략: -{len(a)}줄 +{len(b)}줄 @@"], "inline": [], "truncated": True}
+
+    hunks: List[str] = []
+    inline: List[str] = []
+    inline_budget = [DIFF_STEP_BUDGET]  # shared by every replaced line of this diff
+    # group into hunks separated by > 2*context unchanged lines
+    i, ai, bi = 0, start, start
+    n = len(ops)
+    while i < n:
+        if ops[i][0] == " ":
+            i += 1
+            ai += 1
+            bi += 1
+            continue
+        h0 = max(i - DIFF_CONTEXT, 0)
+        while h0 < i and ops[h0][0] != " ":
+            h0 += 1
+        back = i - h0
+        j, gap = i, 0
+        while j < n and gap <= 2 * DIFF_CONTEXT:
+            gap = gap + 1 if ops[j][0] == " " else 0
+            j += 1
+        h1 = j - max(gap - DIFF_CONTEXT, 0)
+        seg = ops[h0:h1]
+        la = sum(1 for op, _ in seg if op != "+")
+        lb = sum(1 for op, _ in seg if op != "-")
+        hunks.append(f"@@ -{ai - back + 1},{la} +{bi - back + 1},{lb} @@")
+        hunks.extend(f"{op}{line}" for op, line in seg)
+
+        # pair equal-length -/+ runs for char-level refinement
+        k = 0
+        while k < len(seg):
+            if seg[k][0] == "-":
+                dels = []
+                while k < len(seg) and seg[k][0] == "-":
+                    dels.append(seg[k][1])
+                    k += 1
+                adds = []
+                while k < len(seg) and seg[k][0] == "+":
+                    adds.append(seg[k][1])
+                    k += 1
+                if len(dels) == len(adds):
+                    for o, w in zip(dels, adds):
+                        if len(inline) >= DIFF_MAX_LINES or inline_budget[0] <= 0:
+                            break
+                        x = _inline(o, w, inline_budget)
+                        if x is not None:
+                            inline.append(x)
+            else:
+                k += 1
+
+        ai += sum(1 for op, _ in ops[i:h1] if op != "+")
+        bi += sum(1 for op, _ in ops[i:h1] if op != "-")
+        i = h1
+
+    truncated = len(hunks) > DIFF_MAX_LINES
+    if truncated:
+        hunks = hunks[:DIFF_MAX_LINES] + ["… (생략)"]
+    return {"hunks": hunks, "inline": inline[:DIFF_MAX_LINES], "truncated": truncated}
+
+
+def article_hashes(text: str) -> Dict[str, str]:
+    return {key: sha256_stream([art]) for key, art in split_articles(text)}
+
+
+def _entry_article_hashes(entry: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    # Older snapshot entries predate articleHashes; rebuild from the stored body when possible
+    if isinstance(entry.get("articleHashes"), dict):
+        return entry["articleHashes"]
+    body = blob_get(entry.get("bodyHash"))
+    return article_hashes(body) if body is not None else None
+
+
+def detect_article_changes(prev: Dict[str, Any], cur: Dict[str, Any]) -> Optional[Dict[str, List[str]]]:
+    """Which 제N조 were added/removed/modified, by per-article hash; None when either side has no article data."""
+    if (prev.get("bodyHash") or "") == (cur.get("bodyHash") or ""):
+        return {"added": [], "removed": [], "modified": []}
+    old, new = _entry_article_hashes(prev), _entry_article_hashes(cur)
+    if old is None or new is None:
+        return None
+    return {
+        "added": [k for k in new if k not in old],
+        "removed": [k for k in old if k not in new],
+        "modified": [k for k in new if k in old and old[k] != new[k]],
+    }
+
+
+def article_summary(ch: Optional[Dict[str, List[str]]]) -> str:
+    if not ch:
+        return ""
+    parts = [f"{label} {', '.join(ch[k])}" for k, label in (("modified", "수정"), ("added", "신설"), ("removed", "삭제")) if ch[k]]
+    return " / ".join(parts)
+
+
+def body_diff(prev: Dict[str, Any], cur: Dict[str, Any],
+              ch: Optional[Dict[str, List[str]]] = None) -> List[Dict[str, Any]]:
+    """Article-level diff of 조문내용; only articles whose hashes differ are looked at."""
+    if ch is None:
+        ch = detect_article_changes(prev, cur)
+    if ch is None:
+        old, new = blob_get(prev.get("bodyHash")), blob_get(cur.get("bodyHash"))
+        return article_diff(old, new) if old is not None and new is not None else []
+    if not any(ch.values()):
+        return []
+
+    new_map = dict(split_articles(blob_get(cur.get("bodyHash")) or ""))
+    old_map = dict(split_articles(blob_get(prev.get("bodyHash")) or "")) if ch["removed"] or ch["modified"] else {}
+    out = [{"article": k, "change": "added", "title": _article_title(new_map.get(k, k))} for k in ch["added"]]
+    out += [{"article": k, "change": "modified", "title": _article_title(new_map.get(k, k)),
+             **(text_diff(old_map[k], new_map[k]) if k in old_map and k in new_map else {})}
+            for k in ch["modified"]]
+    out += [{"article": k, "change": "removed", "title": _article_title(old_map.get(k, k))} for k in ch["removed"]]
+    # Keep new-body order for added/modified
+    order = {k: i for i, k in enumerate(new_map)}
+    return sorted(out, key=lambda d: (d["change"] == "removed", order.get(d["article"], 0)))
+
+
+def supp_diff(prev: Dict[str, Any], cur: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Text diff of 부칙/별표 (every non-body blob field) when their stored blobs differ."""
+    out: List[Dict[str, Any]] = []
+    pb, cb = prev.get("blobs") or {}, cur.get("blobs") or {}
+    body = ADAPTERS[cur.get("target") or "admrul"].body_fields[0]
+    for field in cb:
+        if field == body or not pb.get(field) or not cb.get(field) or pb[field] == cb[field]:
+            continue
+        label = field[:-2] if field.endswith("내용") else field
+        old, new = blob_get(pb[field]), blob_get(cb[field])
+        if old is None or new is None:
+            continue
+        out.append({"article": label, "change": "modified", "title": label, **text_diff(old, new)})
+    return out
+
+
+# ==========================
+# Core build
+# ==========================
+
+# (best, adm_id, done): `done` is a finished entry (error or carried forward) that needs no detail call
+Resolved = Tuple[Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]
+
+
+def _search_query(std_item: Dict[str, Any]) -> Tuple[str, int]:
+    query = std_item.get("query") or std_item.get("title") or std_item.get("code")
+    return query, int(std_item.get("knd", 3))
+
+
+def _search_error(std_item: Dict[str, Any], prev_entry: Dict[str, Any], error: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **(prev_entry or {}),
+        "code": std_item.get("code"),
+        "title": std_item.get("title"),
+        "checkedAt": TODAY,
+        "error": {"where": "search", **error},
+    }
+
+
+def _resolve_hit(std_item: Dict[str, Any], prev_entry: Dict[str, Any], query: str,
+                 best: Optional[Dict[str, Any]]) -> Resolved:
+    """Turn a standard's top-ranked hit into (best, adm_id, error_or_carried_entry)."""
+    src = ADAPTERS[_target(std_item)]
+    if not best:
+        return None, None, _search_error(std_item, prev_entry, {"kind": "no_results", "query": query})
+
+    adm_id = src.item_id(best)
+    if not adm_id:
+        return None, None, _search_error(std_item, prev_entry, {"kind": "id_missing", "query": query})
+
+    adm_id = str(adm_id)
+    if _can_carry_forward(prev_entry, best, adm_id, src):
+        return best, adm_id, _carry_forward(prev_entry)
+    return best, adm_id, None
+
+
+def _can_carry_forward(prev_entry: Dict[str, Any], best: Dict[str, Any], adm_id: str,
+                       src: Optional[SourceAdapter] = None) -> bool:
+    """True when the search hit proves the previous snapshot entry is still current."""
+    if not INCREMENTAL or not prev_entry or prev_entry.get("error"):
+        return False
+    if not prev_entry.get("bodyHash") or str(prev_entry.get("lawgoId") or "") != adm_id:
+        return False
+    announce = (src or ADAPTERS["admrul"]).hit(best, "date")
+    if not announce or ymd_int_to_dot(announce) != prev_entry.get("announceDate"):
+        return False
+
+    # Periodic forced refresh so body hashes are still verified against the detail payload
+    try:
+        verified = datetime.strptime(prev_entry.get("verifiedAt") or "", "%Y-%m-%d").date()
+    except ValueError:
+        return False
+    return (NOW.date() - verified).days < FULL_REFRESH_DAYS
+
+
+def _carry_forward(prev_entry: Dict[str, Any]) -> Dict[str, Any]:
+    _bump(_RUN_STATS, "detailSkipped")
+    return {**prev_entry, "checkedAt": TODAY}
+
+
+def _entry_from_detail(std_item: Dict[str, Any], prev_entry: Dict[str, Any], best: Dict[str, Any], adm_id: str,
+                       det: Optional[Dict[str, Any]], derr: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     if derr:
         return {
             **(prev_entry or {}),
@@ -292,40 +1773,89 @@ def build_snapshot_entry(std_item: Dict[str, Any], tab_key: str, prev_entry: Dic
             "error": {"where": "detail", **derr},
         }
 
-    payload = _extract_payload(det or {})
-
-    notice_no = payload.get("발령번호")
-    announce = ymd_int_to_dot(payload.get("발령일자"))
-    effective = ymd_int_to_dot(payload.get("시행일자"))
-    rev = payload.get("제개정구분명")
-    org = payload.get("소관부처명")
-    name = payload.get("행정규칙명") or std_item.get("title")
-
-    body_hash = sha256_text(payload.get("조문내용") or "")
-    add_hash = sha256_text((payload.get("부칙내용") or "") + (payload.get("별표내용") or ""))
+    src = ADAPTERS[_target(std_item)]
+    payload = src.extract_payload(det or {})
+    meta = src.meta(payload)
+    meta["ruleName"] = meta.get("ruleName") or std_item.get("title")
 
-    html_url = best.get("행정규칙상세링크") or best.get("상세링크") or ""
-    if not html_url:
-        # DRF HTML (clickable) - safe for users
-        html_url = f"{LAW_SERVICE}?OC={urllib.parse.quote(LAWGO_OC)}&target=admrul&ID={adm_id}&type=HTML"
+    texts = src.texts(payload)
+    body_field, *supp_fields = src.body_fields
+    body_hash = sha256_stream([texts[body_field]])
+    add_hash = sha256_stream([texts[f] for f in supp_fields])
+    blobs = {f: blob_put(texts[f], body_hash if f == body_field else None) for f in src.body_fields}
+    art_hashes = article_hashes(texts[body_field])
 
     return {
         "code": std_item.get("code"),
         "title": std_item.get("title"),
+        **({"target": src.target} if src.target != "admrul" else {}),
         "checkedAt": TODAY,
+        "verifiedAt": TODAY,
         "lawgoId": str(adm_id),
-        "noticeNo": notice_no,
-        "announceDate": announce,
-        "effectiveDate": effective,
-        "revisionType": rev,
-        "orgName": org,
-        "ruleName": name,
-        "htmlUrl": html_url,
+        **meta,
+        "htmlUrl": src.html_url(best, adm_id),
         "bodyHash": body_hash,
         "suppHash": add_hash,
+        "articleHashes": art_hashes,
+        "blobs": blobs,
     }
 
 
+def _unknown_target(std_item: Dict[str, Any], prev_entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if _target(std_item) in ADAPTERS:
+        return None
+    return {
+        **(prev_entry or {}),
+        "code": std_item.get("code"),
+        "title": std_item.get("title"),
+        "checkedAt": TODAY,
+        "error": {"where": "config", "kind": "unknown_target", "target": _target(std_item)},
+    }
+
+
+# (query, search_json, err) of one standard's search
+Searched = Tuple[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def search_entry(std_item: Dict[str, Any]) -> Searched:
+    query, knd = _search_query(std_item)
+    with timed("resolve", code=std_item.get("code")):
+        search_json, err = lawgo_search(query, knd=knd, target=_target(std_item))
+    return query, search_json, err
+
+
+async def search_entry_async(std_item: Dict[str, Any]) -> Searched:
+    query, knd = _search_query(std_item)
+    with timed("resolve", code=std_item.get("code")):
+        search_json, err = await lawgo_search_async(query, knd=knd, target=_target(std_item))
+    return query, search_json, err
+
+
+def resolve_searches(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+                     searched: Dict[int, Searched]) -> Dict[int, Resolved]:
+    """Pick every searched standard's hit with one rank_items pass per (target, orgName) group."""
+    out: Dict[int, Resolved] = {}
+    groups: Dict[Tuple[str, str], Dict[int, List[Dict[str, Any]]]] = {}
+    for i, (query, search_json, err) in searched.items():
+        _, item, prev = jobs[i]
+        if err and err.get("kind") == "over_budget":
+            out[i] = None, None, _deferred(item, prev)
+            continue
+        if err:
+            out[i] = None, None, _search_error(item, prev, {**err, "query": query})
+            continue
+        src = ADAPTERS[_target(item)]
+        groups.setdefault((src.target, item.get("orgName", "소방청")), {})[i] = src.extract_items(search_json or {})
+
+    for (target, org_name), hits in groups.items():
+        titles = {i: jobs[i][1].get("title") or "" for i in hits}
+        ranked = rank_items(hits, org_name=org_name, titles=titles, top_k=1, fields=ADAPTERS[target].hit_fields)
+        for i, top in ranked.items():
+            _, item, prev = jobs[i]
+            out[i] = _resolve_hit(item, prev, searched[i][0], top[0][1] if top else None)
+    return out
+
+
 def detect_change(prev: Dict[str, Any], cur: Dict[str, Any]) -> Tuple[bool, List[str]]:
     if not prev:
         return False, []
@@ -340,113 +1870,1048 @@ def detect_change(prev: Dict[str, Any], cur: Dict[str, Any]) -> Tuple[bool, List
 
 
 # ==========================
-# Main
+# Run history (segmented)
 # ==========================
 
-def main() -> None:
-    if not MOCK and not LAWGO_OC:
-        # No OC and not mock -> cannot proceed, but write an error record and exit 0
-        data = load(OUTPUT_DATA, {"lastRun": None, "records": []})
-        rec = {
-            "id": TODAY,
-            "date": TODAY,
-            "scope": "NFPC / NFTC TEST",
-            "result": "오류",
-            "summary": "LAWGO_OC 미설정 (테스트는 LAWGO_MOCK=1 또는 LAWGO_OC 필요)",
-            "changes": [],
-            "errors": [{"kind": "missing_secret", "where": "runtime", "message": "LAWGO_OC empty"}],
-            "refs": [],
-        }
-        data["lastRun"] = TODAY
-        data["records"] = [r for r in data.get("records", []) if r.get("date") != TODAY]
-        data["records"].insert(0, rec)
-        save(OUTPUT_DATA, data)
-        print("Done (missing LAWGO_OC).")
+def _segment_path(month: str) -> str:
+    return f"{OUTPUT_HISTORY}/{month}.json"
+
+
+def _set_segment(index: Dict[str, Any], month: str, seg: Dict[str, Any]) -> None:
+    segs = [x for x in index.get("segments", []) if x.get("month") != month]
+    segs.append({"month": month, "path": _segment_path(month), "count": len(seg.get("records", []))})
+    index["segments"] = sorted(segs, key=lambda x: x["month"], reverse=True)
+
+
+def migrate_history(index: Dict[str, Any]) -> None:
+    """One-off: move a pre-segment data file's full record list into monthly segments."""
+    if "segments" in index:
         return
+    index["segments"] = []
+    by_month: Dict[str, List[Dict[str, Any]]] = {}
+    for r in index.get("records", []):
+        by_month.setdefault(str(r.get("date") or "")[:7] or "unknown", []).append(r)
+    for month, recs in by_month.items():
+        seg = load(_segment_path(month), {"month": month, "records": []})
+        dates = {r.get("date") for r in recs}
+        seg["records"] = recs + [r for r in seg.get("records", []) if r.get("date") not in dates]
+        os.makedirs(OUTPUT_HISTORY, exist_ok=True)
+        save(_segment_path(month), seg)
+        _set_segment(index, month, seg)
+    index["records"] = index.get("records", [])[:INDEX_RECENT]
+
+
+def append_record(rec: Dict[str, Any]) -> None:
+    """Replace today's record in the current month's segment and refresh the index; cost is independent of history length."""
+    index = load(OUTPUT_DATA, {"lastRun": None, "records": []})
+    migrate_history(index)
+
+    month = rec["date"][:7]
+    seg = load(_segment_path(month), {"month": month, "records": []})
+    seg["records"] = [r for r in seg.get("records", []) if r.get("date") != rec["date"]]
+    seg["records"].insert(0, rec)
+    os.makedirs(OUTPUT_HISTORY, exist_ok=True)
+    save(_segment_path(month), seg)
+    _set_segment(index, month, seg)
+
+    index["lastRun"] = TODAY
+    index["records"] = [r for r in index.get("records", []) if r.get("date") != rec["date"]]
+    index["records"].insert(0, rec)
+    index["records"] = index["records"][:INDEX_RECENT]
+    save(OUTPUT_DATA, index)
+
 
+# ==========================
+# Standards registry
+# ==========================
+
+def _days_since(ymd: Optional[str]) -> Optional[int]:
+    try:
+        return (NOW.date() - datetime.strptime(ymd or "", "%Y-%m-%d").date()).days
+    except ValueError:
+        return None
+
+
+def registry_lookup(registry: Dict[str, Any], tab_key: str, std_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Registry record usable in place of a search, or None."""
+    if REGISTRY_DAYS <= 0:
+        return None
+    rec = (registry.get(tab_key) or {}).get(std_item.get("code")) or {}
+    if not rec.get("id") or rec.get("query") != _search_query(std_item)[0]:
+        return None
+    # Search-only sources have nothing to fetch without the search
+    src = ADAPTERS.get(_target(std_item))
+    if src is None or not src.has_detail or (rec.get("target") or "admrul") != src.target:
+        return None
+    age = _days_since(rec.get("resolvedAt"))
+    if age is None or age >= REGISTRY_DAYS:
+        return None
+    return rec
+
+
+def _registry_resolved(rec: Dict[str, Any], std_item: Dict[str, Any]) -> Resolved:
+    _bump(_RUN_STATS, "registryReused")
+    src = ADAPTERS[_target(std_item)]
+    return {**(rec.get("hit") or {}), src.id_fields[0]: rec["id"]}, str(rec["id"]), None
+
+
+def _detail_not_found(det: Optional[Dict[str, Any]], derr: Optional[Dict[str, Any]], src: SourceAdapter) -> bool:
+    """The pinned ID is gone (404/410 or an empty payload); transient errors keep the registry record."""
+    if derr:
+        return derr.get("status") in (404, 410)
+    return not src.found(src.extract_payload(det or {}))
+
+
+def registry_update(registry: Dict[str, Any], jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+                    resolved: List[Resolved], results: List[Dict[str, Any]], from_search: List[bool]) -> None:
+    for (tab_key, item, _), (best, adm_id, _), cur, searched in zip(jobs, resolved, results, from_search):
+        if not best or not adm_id:
+            continue
+        tab = registry.setdefault(tab_key, {})
+        rec = tab.get(item.get("code")) or {}
+        if searched:
+            src = ADAPTERS[_target(item)]
+            rec = {
+                "id": adm_id,
+                **({"target": src.target} if src.target != "admrul" else {}),
+                "query": _search_query(item)[0],
+                "hit": {k: best.get(k) for k in (src.id_fields[0], *src.hit_fields.values()) if best.get(k) is not None},
+                "score": score_item(best, item.get("orgName", "소방청"), src.hit_fields, item.get("title") or ""),
+                "resolvedAt": TODAY,
+                "verifiedAt": rec.get("verifiedAt") if rec.get("id") == adm_id else None,
+            }
+        if not cur.get("error"):
+            rec["verifiedAt"] = TODAY
+        tab[item.get("code")] = rec
+
+
+def registry_prune(registry: Dict[str, Any], jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]) -> None:
+    """Drop codes no longer listed in the standards files."""
+    live: Dict[str, set] = {}
+    for tab_key, item, _ in jobs:
+        live.setdefault(tab_key, set()).add(item.get("code"))
+    for tab_key in list(registry):
+        registry[tab_key] = {c: r for c, r in registry[tab_key].items() if c in live.get(tab_key, set())}
+
+
+# ==========================
+# Catalog discovery
+# ==========================
+
+_CODE_RE = re.compile(r"\b(NF[PT]C)\s*(\d+[A-Z]?)")
+
+
+def standard_code(name: str) -> Optional[str]:
+    m = _CODE_RE.search(name or "")
+    return f"{m.group(1)} {m.group(2)}" if m else None
+
+
+def _catalog_add(catalog: Dict[str, Any], it: Dict[str, Any]) -> None:
+    src = ADAPTERS[DISCOVERY_TARGET]
+    name = src.hit(it, "name") or ""
+    key = standard_code(name) or name
+    if not key:
+        return
+    date = str(src.hit(it, "date") or "")
+    old = catalog.get(key)
+    if old and (old.get("date") or "") > date:
+        return
+    catalog[key] = {
+        "code": standard_code(name),
+        "name": name,
+        "id": str(src.item_id(it) or ""),
+        "date": date,
+        "revision": it.get("제개정구분명"),
+        "org": src.hit(it, "org"),
+    }
+
+
+def _crawl_query(query: str, qs: Dict[str, Any], catalog: Dict[str, Any], checkpoint: Any,
+                 org_name: str = "소방청") -> Dict[str, Any]:
+    """Page one query (sort=ddes) until a short page or an already-seen 발령일자.
+
+    Progress is checkpointed after every page (qs["cursor"]) so an interrupted crawl resumes where it stopped;
+    qs["lastSeen"] only advances once the query completes.
+    """
+    src = ADAPTERS[DISCOVERY_TARGET]
+    last = qs.get("lastSeen") or ""
+    start = int(qs.get("cursor") or 1)
+    newest = qs.get("pendingNewest") or ""
+    pages = 0
+    page = start
+    # A daily incremental pass usually stops on page 1; fetch pages in windows only for a full crawl or a resume
+    window = 1 if last and not qs.get("cursor") else CONCURRENCY
+    for page, items, err in lawgo_search_pages(query, knd=DISCOVERY_KND, display=DISCOVERY_DISPLAY,
+                                               max_pages=DISCOVERY_MAX_PAGES, target=DISCOVERY_TARGET,
+                                               start=start, window=window):
+        if err:
+            qs["cursor"] = page
+            qs["pendingNewest"] = newest
+            checkpoint()
+            return {"query": query, "pages": pages, "error": {**err, "page": page}}
+        pages += 1
+        dates = [str(src.hit(it, "date") or "") for it in items]
+        for it, date in zip(items, dates):
+            if org_name and org_name not in (src.hit(it, "org") or ""):
+                continue
+            _catalog_add(catalog, it)
+            newest = max(newest, date)
+        if len(items) < DISCOVERY_DISPLAY or (last and any(d <= last for d in dates)):
+            break
+        qs["cursor"] = page + 1
+        qs["pendingNewest"] = newest
+        checkpoint()
+    else:
+        # no short page: the pager either reached totalCnt (done) or the page cap
+        if page >= DISCOVERY_MAX_PAGES:
+            return {"query": query, "pages": pages, "error": {"kind": "max_pages", "page": int(qs.get("cursor") or start)}}
+
+    qs["lastSeen"] = max(last, newest)
+    qs.pop("cursor", None)
+    qs.pop("pendingNewest", None)
+    if not last:
+        qs["fullCrawlAt"] = TODAY
+    checkpoint()
+    return {"query": query, "pages": pages}
+
+
+def discover(listed: Dict[str, set]) -> Dict[str, Any]:
+    """Crawl 소방청 admrul search results and diff the catalog against the listed NFPC/NFTC codes."""
+    state = load(OUTPUT_DISCOVERY, {"queries": {}, "catalog": {}})
+    catalog = state.setdefault("catalog", {})
+    lock = threading.Lock()
+
+    def checkpoint() -> None:
+        with lock:
+            save(OUTPUT_DISCOVERY, state)
+
+    runs = []
+    with timed("discover"):
+        for q in DISCOVERY_QUERIES:
+            if over_budget():
+                break  # untouched queries keep their state for the next run
+            runs.append(_crawl_query(q, state.setdefault("queries", {}).setdefault(q, {}), catalog, checkpoint))
+
+    listed_all = set().union(*listed.values()) if listed else set()
+    found = {v["code"]: v for v in catalog.values() if v.get("code")}
+    complete = all(state["queries"].get(q, {}).get("fullCrawlAt") for q in DISCOVERY_QUERIES)
+
+    withdrawn = sorted(c for c in listed_all if (found.get(c) or {}).get("revision") == "폐지")
+    if complete:
+        # after a full crawl, a listed code that never shows up is also treated as withdrawn
+        withdrawn = sorted(set(withdrawn) | {c for c in listed_all if c not in found})
+    new = sorted(c for c, v in found.items() if c not in listed_all and v.get("revision") != "폐지")
+
+    state["lastRun"] = TODAY
+    checkpoint()
+    return {
+        "queries": runs,
+        "catalogSize": len(catalog),
+        "complete": complete,
+        "new": [{"code": c, "name": found[c]["name"], "date": found[c]["date"]} for c in new],
+        "withdrawn": withdrawn,
+    }
+
+
+# ==========================
+# Run journal (checkpoints)
+# ==========================
+
+def journal_load() -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Entries already checked today by an interrupted run, keyed by (tab, code)."""
+    done: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    try:
+        with open(OUTPUT_JOURNAL, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # torn last line from a killed run
+                if rec.get("date") == TODAY:
+                    done[(rec["tab"], rec["code"])] = rec["entry"]
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def journal_append(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]], results: List[Dict[str, Any]]) -> None:
+    with open(OUTPUT_JOURNAL, "a", encoding="utf-8") as f:
+        for (tab_key, item, _), cur in zip(jobs, results):
+            err = cur.get("error") or {}
+            if cur.get("deferred") or (err and (err.get("kind") == "circuit_open" or _is_retryable(err) or _is_outage(err))):
+                continue  # not checked, or failed transiently; a same-day rerun should pick it up
+            f.write(json.dumps({"date": TODAY, "tab": tab_key, "code": item.get("code"), "entry": cur},
+                               ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def journal_clear() -> None:
+    try:
+        os.remove(OUTPUT_JOURNAL)
+    except FileNotFoundError:
+        pass
+
+
+# ==========================
+# Scheduling (priority + wall-clock budget)
+# ==========================
+
+# time.perf_counter() after which no new search/detail request is started (None = unlimited)
+_DEADLINE: Optional[float] = None
+
+
+def _date_dot(s: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.strptime(s or "", "%Y.%m.%d")
+    except ValueError:
+        return None
+
+
+def priority(prev: Dict[str, Any], weights: Optional[Dict[str, float]] = None) -> float:
+    """How urgently a standard should be checked, from its snapshot entry alone.
+
+    new (never checked), error (last check failed), stale (days since checkedAt, 1.0 at 7 days),
+    recent (amended within the last year, 1.0 = today), effective (effectiveDate within the next
+    30 days, 1.0 = today). Higher runs first.
+    """
+    w = {**PRIORITY_WEIGHTS, **(weights or {})}
+    if not prev:
+        return w["new"]
+    today = datetime.strptime(TODAY, "%Y-%m-%d")
+    score = w["error"] if prev.get("error") else 0.0
+
+    age = _days_since(prev.get("checkedAt"))
+    score += w["stale"] * min(1.0, (age if age is not None else 7) / 7.0)
+
+    announced = _date_dot(prev.get("announceDate"))
+    if announced:
+        score += w["recent"] * max(0.0, 1.0 - (today - announced).days / 365.0)
+
+    effective = _date_dot(prev.get("effectiveDate"))
+    if effective and 0 <= (effective - today).days <= 30:
+        score += w["effective"] * (1.0 - (effective - today).days / 30.0)
+    return score
+
+
+def schedule(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+    """Jobs by descending priority; ties keep list order."""
+    return sorted(jobs, key=lambda j: -priority(j[2]))
+
+
+def _code_hash(tab_key: str, code: Any, salt: str = "") -> int:
+    """Stable across runs, machines and Python versions (unlike hash())."""
+    return int(hashlib.sha256(f"{salt}{tab_key}:{code}".encode("utf-8")).hexdigest()[:8], 16)
+
+
+def tier(std_item: Dict[str, Any], prev: Dict[str, Any]) -> str:
+    """Declared "tier" in the standards file, else derived from the snapshot entry's change history.
+
+    hot: never checked, last check failed, amended within 90 days or not yet in force;
+    warm: amended within 2 years; cold: older.
+    """
+    if std_item.get("tier") in TIER_DAYS:
+        return std_item["tier"]
+    if not prev or prev.get("error"):
+        return "hot"
+    today = datetime.strptime(TODAY, "%Y-%m-%d")
+    effective = _date_dot(prev.get("effectiveDate"))
+    if effective and effective > today:
+        return "hot"
+    announced = _date_dot(prev.get("announceDate"))
+    if announced is None:
+        return "hot"
+    age = (today - announced).days
+    return "hot" if age <= 90 else "warm" if age <= 730 else "cold"
+
+
+def is_due(tab_key: str, std_item: Dict[str, Any], prev: Dict[str, Any], tier_name: str) -> bool:
+    """Due on the standard's own slot day (stable hash of tab/code mod period) or once a full period is overdue."""
+    period = max(1, int(TIER_DAYS[tier_name]))
+    slot = _code_hash(tab_key, std_item.get("code")) % period
+    if NOW.date().toordinal() % period == slot:
+        return True
+    age = _days_since((prev or {}).get("checkedAt"))
+    return age is None or age >= period
+
+
+def over_budget() -> bool:
+    return _DEADLINE is not None and time.perf_counter() >= _DEADLINE
+
+
+def _deferred(std_item: Dict[str, Any], prev_entry: Dict[str, Any]) -> Dict[str, Any]:
+    _bump(_RUN_STATS, "deferred")
+    return {**(prev_entry or {}), "code": std_item.get("code"), "title": std_item.get("title"), "deferred": True}
+
+
+# ==========================
+# Execution
+# ==========================
+
+# Detail requests are keyed by (target, id): IDs are only unique within one DRF target
+DetailKey = Tuple[str, str]
+
+
+def _fetched(res: Optional[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]) -> bool:
+    """False for a detail skipped or abandoned at the deadline."""
+    return res is not None and (res[1] or {}).get("kind") != "over_budget"
+
+
+def lawgo_detail_batch(ids: List[DetailKey], concurrency: int = CONCURRENCY,
+                       timings: Optional[Dict[DetailKey, float]] = None
+                       ) -> Dict[DetailKey, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    """Fetch many detail IDs in parallel (DRF has no multi-ID call); {(target, id): (json, err)} with per-ID errors.
+
+    `timings`, if given, receives each fetch's duration in ms.
+    """
+    uniq = list(dict.fromkeys((t, str(i)) for t, i in ids))
+    timings = timings if timings is not None else {}
+
+    def one(key: DetailKey) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        if over_budget():
+            return None
+        t0 = time.perf_counter()
+        try:
+            return lawgo_detail(key[1], target=key[0])
+        finally:
+            timings[key] = (time.perf_counter() - t0) * 1000
+
+    # IDs not fetched before the deadline are left out (their jobs are deferred)
+    with timed("detail_batch", ids=len(uniq)):
+        if concurrency <= 1 or len(uniq) <= 1:
+            got = [one(k) for k in uniq]
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(uniq))) as ex:
+                got = list(ex.map(one, uniq))
+        return {k: v for k, v in zip(uniq, got) if _fetched(v)}
+
+
+async def lawgo_detail_batch_async(ids: List[DetailKey], concurrency: int = CONCURRENCY,
+                                   timings: Optional[Dict[DetailKey, float]] = None
+                                   ) -> Dict[DetailKey, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    uniq = list(dict.fromkeys((t, str(i)) for t, i in ids))
+    sem = asyncio.Semaphore(max(concurrency, 1))
+    timings = timings if timings is not None else {}
+
+    async def one(key: DetailKey) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+        async with sem:
+            if over_budget():
+                return None
+            t0 = time.perf_counter()
+            try:
+                return await lawgo_detail_async(key[1], target=key[0])
+            finally:
+                timings[key] = (time.perf_counter() - t0) * 1000
+
+    with timed("detail_batch", ids=len(uniq)):
+        got = await asyncio.gather(*(one(i) for i in uniq))
+        return {k: v for k, v in zip(uniq, got) if _fetched(v)}
+
+
+def _detail_keys(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]], resolved: List[Resolved],
+                 idx: Optional[Iterable[int]] = None) -> List[DetailKey]:
+    """Detail requests still needed (search-only sources and finished entries need none)."""
+    keys = []
+    for i in (range(len(jobs)) if idx is None else idx):
+        target, (_, adm_id, done) = _target(jobs[i][1]), resolved[i]
+        if not done and ADAPTERS[target].has_detail:
+            keys.append((target, adm_id))
+    return keys
+
+
+def _detail_for(item: Dict[str, Any], best: Optional[Dict[str, Any]], adm_id: str,
+                details: Dict[DetailKey, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]
+                ) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    """(json, err) for a resolved job, or None when its detail was not fetched before the deadline."""
+    target = _target(item)
+    return details.get((target, adm_id)) if ADAPTERS[target].has_detail else (best, None)
+
+
+def _finish(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]], resolved: List[Resolved],
+            details: Dict[DetailKey, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    out = []
+    for (tab_key, item, prev), (best, adm_id, done) in zip(jobs, resolved):
+        got = None if done else _detail_for(item, best, adm_id, details)
+        if done:
+            out.append(done)
+        elif got is None:
+            out.append(_deferred(item, prev))
+        else:
+            out.append(_entry_from_detail(item, prev, best, adm_id, *got))
+    return out
+
+
+def _entry_timings(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]], resolved: List[Resolved],
+                   spent: List[float], detail_ms: Dict[DetailKey, float]) -> None:
+    """One "entry" perf event per checked standard: its search time plus the detail fetch it waited on
+    (a fetch shared by several standards counts fully for each)."""
+    for (_, item, _), (_, adm_id, done), ms in zip(jobs, resolved, spent):
+        if done and done.get("deferred"):
+            continue
+        if not done:
+            ms += detail_ms.get((_target(item), str(adm_id)), 0.0)
+        perf_event("entry", ms, code=item.get("code"))
+
+
+def _registry_misses(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]], known: List[Optional[Dict[str, Any]]],
+                     resolved: List[Resolved], details: Dict[DetailKey, Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]
+                     ) -> List[int]:
+    """Jobs resolved from the registry whose pinned ID no longer yields a detail payload."""
+    out = []
+    for i, (rec, (best, adm_id, done)) in enumerate(zip(known, resolved)):
+        if rec is None or done:
+            continue
+        item = jobs[i][1]
+        got = _detail_for(item, best, adm_id, details)
+        if got is not None and _detail_not_found(*got, ADAPTERS[_target(item)]):
+            _bump(_RUN_STATS, "registryReresolved")
+            out.append(i)
+    return out
+
+
+def run_checks(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+               concurrency: int = CONCURRENCY,
+               registry: Optional[Dict[str, Any]] = None,
+               chunk: int = 0, checkpoint: Optional[Callable[..., None]] = None) -> List[Dict[str, Any]]:
+    """Check jobs in chunks of `chunk` (0 = all at once), calling checkpoint(jobs, results) after each."""
+    _INFLIGHT.clear()
+    registry = registry if registry is not None else {}
+    results: List[Dict[str, Any]] = []
+    for part in _chunks(jobs, chunk):
+        res = _run_stage(part, concurrency, registry)
+        if checkpoint:
+            checkpoint(part, res)
+        results.extend(res)
+    return results
+
+
+def _chunks(jobs: List[Any], size: int) -> List[List[Any]]:
+    if size <= 0 or len(jobs) <= size:
+        return [jobs] if jobs else []
+    return [jobs[i:i + size] for i in range(0, len(jobs), size)]
+
+
+def _run_stage(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]], concurrency: int,
+               registry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Resolve every search first, then fetch the deduplicated detail IDs in bulk; results keep job order."""
+    known = [registry_lookup(registry, tab_key, item) for tab_key, item, _ in jobs]
+    spent = [0.0] * len(jobs)
+    detail_ms: Dict[DetailKey, float] = {}
+
+    searched: Dict[int, Searched] = {}
+
+    def resolve(i: int) -> Optional[Resolved]:
+        """Resolved without ranking (deferred, registry, bad target), or None once the search is in `searched`."""
+        _, item, prev = jobs[i]
+        if over_budget():
+            return None, None, _deferred(item, prev)
+        t0 = time.perf_counter()
+        try:
+            if known[i]:
+                return _registry_resolved(known[i], item)
+            bad = _unknown_target(item, prev)
+            if bad:
+                return None, None, bad
+            searched[i] = search_entry(item)
+            return None
+        finally:
+            spent[i] += (time.perf_counter() - t0) * 1000
+
+    def resolve_all(idx: List[int]) -> List[Resolved]:
+        searched.clear()
+        if concurrency <= 1 or len(idx) <= 1:
+            got = [resolve(i) for i in idx]
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(idx))) as ex:
+                got = list(ex.map(resolve, idx))
+        ranked = resolve_searches(jobs, searched)
+        return [res if res is not None else ranked[i] for i, res in zip(idx, got)]
+
+    resolved = resolve_all(list(range(len(jobs))))
+    details = lawgo_detail_batch(_detail_keys(jobs, resolved), concurrency, detail_ms)
+
+    # Registry IDs that went stale: search again, then fetch the newly resolved IDs
+    retry = _registry_misses(jobs, known, resolved, details)
+    if retry:
+        for i in retry:
+            known[i] = None
+        for i, res in zip(retry, resolve_all(retry)):
+            resolved[i] = res
+        details.update(lawgo_detail_batch(_detail_keys(jobs, resolved, retry), concurrency, detail_ms))
+
+    results = _finish(jobs, resolved, details)
+    _entry_timings(jobs, resolved, spent, detail_ms)
+    registry_update(registry, jobs, resolved, results, [rec is None for rec in known])
+    return results
+
+
+async def run_checks_async(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+                           concurrency: int = CONCURRENCY,
+                           registry: Optional[Dict[str, Any]] = None,
+                           chunk: int = 0, checkpoint: Optional[Callable[..., None]] = None) -> List[Dict[str, Any]]:
+    """Async counterpart of run_checks: one event loop, at most `concurrency` connections/standards in flight."""
+    global _ASYNC_CLIENT
+    _INFLIGHT_ASYNC.clear()
+    registry = registry if registry is not None else {}
+
+    async def run() -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        for part in _chunks(jobs, chunk):
+            res = await _run_stage_async(part, concurrency, registry)
+            if checkpoint:
+                checkpoint(part, res)
+            results.extend(res)
+        return results
+
+    if MOCK:
+        return await run()
+
+    import httpx
+
+    limits = httpx.Limits(max_connections=max(concurrency, 1), max_keepalive_connections=max(concurrency, 1))
+    async with httpx.AsyncClient(limits=limits) as client:
+        _ASYNC_CLIENT = client
+        try:
+            return await run()
+        finally:
+            _ASYNC_CLIENT = None
+
+
+async def _run_stage_async(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]], concurrency: int,
+                           registry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    sem = asyncio.Semaphore(max(concurrency, 1))
+    known = [registry_lookup(registry, tab_key, item) for tab_key, item, _ in jobs]
+    spent = [0.0] * len(jobs)
+    detail_ms: Dict[DetailKey, float] = {}
+
+    searched: Dict[int, Searched] = {}
+
+    async def one(i: int) -> Optional[Resolved]:
+        _, item, prev = jobs[i]
+        if over_budget():
+            return None, None, _deferred(item, prev)
+        if known[i]:
+            return _registry_resolved(known[i], item)
+        bad = _unknown_target(item, prev)
+        if bad:
+            return None, None, bad
+        async with sem:
+            if over_budget():
+                return None, None, _deferred(item, prev)
+            t0 = time.perf_counter()
+            try:
+                searched[i] = await search_entry_async(item)
+                return None
+            finally:
+                spent[i] += (time.perf_counter() - t0) * 1000
+
+    async def resolve_all(idx: List[int]) -> List[Resolved]:
+        searched.clear()
+        got = await asyncio.gather(*(one(i) for i in idx))
+        ranked = resolve_searches(jobs, searched)
+        return [res if res is not None else ranked[i] for i, res in zip(idx, got)]
+
+    resolved = await resolve_all(list(range(len(jobs))))
+    details = await lawgo_detail_batch_async(_detail_keys(jobs, resolved), concurrency, detail_ms)
+
+    retry = _registry_misses(jobs, known, resolved, details)
+    if retry:
+        for i in retry:
+            known[i] = None
+        for i, res in zip(retry, await resolve_all(retry)):
+            resolved[i] = res
+        details.update(await lawgo_detail_batch_async(_detail_keys(jobs, resolved, retry), concurrency, detail_ms))
+
+    results = _finish(jobs, resolved, details)
+    _entry_timings(jobs, resolved, spent, detail_ms)
+    registry_update(registry, jobs, resolved, results, [rec is None for rec in known])
+    return results
+
+
+# ==========================
+# Sharding (--shard-index/--shard-count, --merge)
+# ==========================
+
+def in_shard(tab_key: str, code: Any, index: int, count: int) -> bool:
+    """Stable hash partition; salted so shards do not line up with cadence slots."""
+    return count <= 1 or _code_hash(tab_key, code, "shard:") % count == index
+
+
+def _shard_path(index: int, count: int) -> str:
+    return os.path.join(OUTPUT_SHARDS, f"shard-{index:03d}-of-{count:03d}.json")
+
+
+# meta counters summed across shards by --merge (None = every numeric field); the rest comes from shard 0
+_SHARD_SUMS = {
+    "http": None,
+    "cache": ("hits", "misses", "stores", "evictions"),
+    "rateLimit": ("waits", "waitSeconds", "throttled", "retryAfter"),
+    "registry": ("reused", "reresolved"),
+    "incremental": ("detailSkipped",),
+    "cadence": ("resting", "tiers"),
+    "breaker": ("opened", "rejected", "probes"),
+}
+
+
+def _sum_into(dst: Dict[str, Any], src: Dict[str, Any], keys: Optional[Iterable[str]] = None) -> None:
+    for k in (src if keys is None else keys):
+        v = src.get(k)
+        if isinstance(v, dict):
+            _sum_into(dst.setdefault(k, {}), v)
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            dst[k] = round((dst.get(k) or 0) + v, 3)
+
+
+def write_partial(index: int, count: int, entries: List[Tuple[str, str, Dict[str, Any]]],
+                  changes: List[Tuple[str, Dict[str, Any]]], errors: List[Tuple[str, Dict[str, Any]]],
+                  deferred: List[Tuple[str, str]], registry: Dict[str, Any],
+                  discovery: Optional[Dict[str, Any]], meta: Dict[str, Any]) -> str:
+    """One shard's results; changes/errors are already computed against the snapshot the shard started from."""
+    codes = {(tab_key, code) for tab_key, code, _ in entries}
+    part = {
+        "date": TODAY,
+        "index": index,
+        "count": count,
+        "entries": [[tab_key, code, cur] for tab_key, code, cur in entries],
+        "changes": [list(x) for x in changes],
+        "errors": [list(x) for x in errors],
+        "deferred": [list(x) for x in deferred],
+        "registry": {tab_key: {c: r for c, r in tab.items() if (tab_key, c) in codes} for tab_key, tab in registry.items()},
+        "discovery": discovery,
+        "meta": meta,
+    }
+    os.makedirs(OUTPUT_SHARDS, exist_ok=True)
+    path = _shard_path(index, count)
+    save(path, part)
+    return path
+
+
+def load_partials() -> List[Dict[str, Any]]:
+    """Every shard of one run, by index; exits if any shard is missing or from another run."""
+    files = sorted(f for f in os.listdir(OUTPUT_SHARDS) if f.startswith("shard-") and f.endswith(".json")) \
+        if os.path.isdir(OUTPUT_SHARDS) else []
+    parts = [load(os.path.join(OUTPUT_SHARDS, f), {}) for f in files]
+    if not parts:
+        raise SystemExit(f"--merge: no partial results in {OUTPUT_SHARDS}/")
+    date, count = parts[0].get("date"), parts[0].get("count")
+    found = sorted((p.get("date"), p.get("count"), p.get("index")) for p in parts)
+    if found != [(date, count, i) for i in range(count or 0)]:
+        raise SystemExit(f"--merge: expected shards 0..{(count or 1) - 1} of one run, found (date, count, index) {found}")
+    return sorted(parts, key=lambda p: p["index"])
+
+
+def merge_perf(reports: List[Tuple[int, Dict[str, Any]]], slowest: int = 5) -> Dict[str, Any]:
+    """Combine shard perf_reports. Counts, totals, attempts, bytes and retries are summed and max is exact;
+    percentiles cannot be merged from summaries, so p50/p95 are the worst shard's (each shard keeps its own
+    under "shards"). totalSeconds is the longest shard, since shards run in parallel."""
+    ops: Dict[str, Any] = {}
+    for _, rep in reports:
+        for key, st in (rep.get("ops") or {}).items():
+            dst = ops.setdefault(key, {})
+            _sum_into(dst, st, ("count", "totalMs", "attempts", "bytes", "cached", "retries"))
+            for k in ("p50", "p95", "max"):
+                if st.get(k) is not None:
+                    dst[k] = max(dst.get(k) or 0, st[k])
+    entries = sorted((x for _, rep in reports for x in rep.get("slowest") or []), key=lambda x: -x["ms"])
+    return {
+        "totalSeconds": max((rep.get("totalSeconds") or 0 for _, rep in reports), default=0),
+        "ops": {key: ops[key] for key in sorted(ops)},
+        "slowest": entries[:slowest],
+        "shards": [{"index": index, "totalSeconds": rep.get("totalSeconds"), "ops": rep.get("ops") or {}}
+                   for index, rep in reports],
+    }
+
+
+def merge_shards() -> Dict[str, Any]:
+    """Combine shard partials into snapshot/registry/record. Deterministic (standards-list order, not shard
+    order) and idempotent: rerunning on the same partials rewrites the same bytes."""
+    parts = load_partials()
+    _, _, snap, jobs = load_jobs()
+    order = {(tab_key, item.get("code")): i for i, (tab_key, item, _) in enumerate(jobs)}
+
+    def rank(tab_key: str, code: str) -> int:
+        return order.get((tab_key, code), len(order))
+
+    def ordered(key: str) -> List[Any]:
+        xs = [x for p in parts for x in p.get(key, [])]
+        xs.sort(key=lambda x: rank(x[0], x[1] if isinstance(x[1], str) else x[1].get("code")))
+        return [x[1] for x in xs]
+
+    # New codes are inserted in list order so the files match a single unsharded run
+    entries = sorted((e for p in parts for e in p.get("entries", [])), key=lambda e: rank(e[0], e[1]))
+    for tab_key, code, cur in entries:
+        snap.setdefault(tab_key, {})[code] = cur
+
+    registry = load(OUTPUT_REGISTRY, {})
+    records = sorted(((tab_key, code, r) for p in parts for tab_key, tab in (p.get("registry") or {}).items()
+                      for code, r in tab.items()), key=lambda e: rank(e[0], e[1]))
+    for tab_key, code, r in records:
+        registry.setdefault(tab_key, {})[code] = r
+    registry_prune(registry, jobs)
+
+    meta = json.loads(json.dumps(parts[0]["meta"]))
+    for p in parts[1:]:
+        for sec, keys in _SHARD_SUMS.items():
+            if isinstance(p["meta"].get(sec), dict):
+                _sum_into(meta.setdefault(sec, {}), p["meta"][sec], keys)
+        _sum_into(meta, p["meta"], ("coalesced", "resumed"))
+    deferred = ordered("deferred")
+    meta["schedule"]["deferred"] = deferred
+    meta["discovery"] = next((p["discovery"] for p in parts if p.get("discovery")), None)
+    meta["shards"] = len(parts)
+    meta["perf"] = merge_perf([(p["index"], p["meta"].get("perf") or {}) for p in parts])
+
+    rec = make_record(parts[0]["date"], ordered("changes"), ordered("errors"), deferred, meta["discovery"], meta)
+    save(OUTPUT_REGISTRY, registry)
+    save(OUTPUT_SNAPSHOT, snap)
+    append_record(rec)
+    return rec
+
+
+# ==========================
+# Main
+# ==========================
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="NFPC/NFTC update check (TEST)")
+    ap.add_argument("--no-cache", action="store_true", help="do not read or write the response cache")
+    ap.add_argument("--refresh", action="store_true", help="ignore cached responses but store fresh ones")
+    ap.add_argument("--discover", action="store_true", help="also crawl the 소방청 admrul catalog for new/withdrawn standards")
+    ap.add_argument("--all", action="store_true", help="check every standard today regardless of cadence tier")
+    ap.add_argument("--budget", type=float, default=BUDGET_SECONDS,
+                    help="wall-clock seconds for the run (0 = unlimited); unchecked standards are deferred")
+    ap.add_argument("--shard-index", type=int, default=int(os.getenv("LAWGO_SHARD_INDEX", "0") or "0"))
+    ap.add_argument("--shard-count", type=int, default=int(os.getenv("LAWGO_SHARD_COUNT", "1") or "1"),
+                    help="check only the hash partition shard-index of shard-count and write a partial result")
+    ap.add_argument("--merge", action="store_true", help="combine shard partials into the snapshot and today's record")
+    return ap.parse_args(argv)
+
+
+def load_jobs() -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], List[Tuple[str, Dict[str, Any], Dict[str, Any]]]]:
+    """(nfpc, nftc, snapshot, jobs) with jobs in standards-list order."""
     nfpc = load(STANDARDS_NFPC, {"items": []})
     nftc = load(STANDARDS_NFTC, {"items": []})
 
     snap = load(OUTPUT_SNAPSHOT, {"nfpc": {}, "nftc": {}})
-    data = load(OUTPUT_DATA, {"lastRun": None, "records": []})
-
-    changes: List[Dict[str, Any]] = []
-    errors: List[Dict[str, Any]] = []
 
+    jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = []
     for tab_key, std in (("nfpc", nfpc), ("nftc", nftc)):
         for item in std.get("items", []):
             code = item.get("code")
             if not code:
                 continue
-
             prev = (snap.get(tab_key, {}) or {}).get(code, {})
-            cur = build_snapshot_entry(item, tab_key, prev)
-            snap.setdefault(tab_key, {})[code] = cur
-
-            if cur.get("error"):
-                e = cur["error"]
-                errors.append({
-                    "code": code,
-                    "title": item.get("title"),
-                    "where": e.get("where"),
-                    "kind": e.get("kind"),
-                    "status": e.get("status"),
-                    "contentType": e.get("contentType"),
-                    "head": e.get("head"),
-                    "url": e.get("url"),
-                    "query": e.get("query"),
-                })
-                continue
-
-            changed, diff_keys = detect_change(prev, cur)
-            if changed:
-                changes.append({
-                    "code": code,
-                    "title": item.get("title"),
-                    "noticeNo": cur.get("noticeNo"),
-                    "announceDate": cur.get("announceDate"),
-                    "effectiveDate": cur.get("effectiveDate"),
-                    "reason": f"자동 감지: 메타/본문 해시 변경({', '.join(diff_keys)})",
-                    "diff": [],
-                    "supplementary": "부칙/경과규정은 원문 확인",
-                    "impact": [
-                        "설계: 시행일 기준 적용(도서·시방서에 적용기준 명시)",
-                        "시공: 자재/설비 선정 시 개정기준 충족 여부 확인",
-                        "유지관리: 점검대장에 적용기준/이력 기록",
-                    ],
-                    "refs": [{"label": "법제처(원문/DRF)", "url": cur.get("htmlUrl", "")}],
-                })
-
-    data["lastRun"] = TODAY
-
+            jobs.append((tab_key, item, prev))
+    return nfpc, nftc, snap, jobs
+
+
+def summarize(jobs: List[Tuple[str, Dict[str, Any], Dict[str, Any]]], results: List[Dict[str, Any]]
+              ) -> Tuple[List[Tuple[str, str, Dict[str, Any]]], List[Tuple[str, Dict[str, Any]]],
+                         List[Tuple[str, Dict[str, Any]]], List[Tuple[str, str]]]:
+    """(entries, changes, errors, deferred), each tagged with its tab; results come back in job order, so
+    changes/errors stay deterministic."""
+    entries: List[Tuple[str, str, Dict[str, Any]]] = []
+    changes: List[Tuple[str, Dict[str, Any]]] = []
+    errors: List[Tuple[str, Dict[str, Any]]] = []
+    deferred: List[Tuple[str, str]] = []
+    for (tab_key, item, prev), cur in zip(jobs, results):
+        code = item.get("code")
+        if cur.get("resting"):
+            continue
+        if cur.get("deferred"):
+            # Keep the previous entry as is; its older checkedAt raises its priority next run
+            deferred.append((tab_key, code))
+            continue
+        entries.append((tab_key, code, cur))
+
+        if cur.get("error"):
+            e = cur["error"]
+            errors.append((tab_key, {
+                "code": code,
+                "title": item.get("title"),
+                "where": e.get("where"),
+                "kind": e.get("kind"),
+                "status": e.get("status"),
+                "contentType": e.get("contentType"),
+                "head": e.get("head"),
+                "url": e.get("url"),
+                "query": e.get("query"),
+            }))
+            continue
+
+        changed, diff_keys = detect_change(prev, cur)
+        if changed:
+            articles = detect_article_changes(prev, cur) if "bodyHash" in diff_keys else None
+            reason = f"자동 감지: 메타/본문 해시 변경({', '.join(diff_keys)})"
+            if article_summary(articles):
+                reason += f" — 조문 {article_summary(articles)}"
+            changes.append((tab_key, {
+                "code": code,
+                "title": item.get("title"),
+                "noticeNo": cur.get("noticeNo"),
+                "announceDate": cur.get("announceDate"),
+                "effectiveDate": cur.get("effectiveDate"),
+                "reason": reason,
+                "articles": articles,
+                "diff": body_diff(prev, cur, articles) + (supp_diff(prev, cur) if "suppHash" in diff_keys else []),
+                "supplementary": "부칙/경과규정은 원문 확인",
+                "impact": [
+                    "설계: 시행일 기준 적용(도서·시방서에 적용기준 명시)",
+                    "시공: 자재/설비 선정 시 개정기준 충족 여부 확인",
+                    "유지관리: 점검대장에 적용기준/이력 기록",
+                ],
+                "refs": [{"label": "법제처(원문/DRF)", "url": cur.get("htmlUrl", "")}],
+            }))
+    return entries, changes, errors, deferred
+
+
+def make_record(date: str, changes: List[Dict[str, Any]], errors: List[Dict[str, Any]], deferred: List[str],
+                discovery: Optional[Dict[str, Any]], meta: Dict[str, Any]) -> Dict[str, Any]:
     if changes:
         result = "변경 있음"
         summary = f"자동 감지: {len(changes)}건 변경(원문 확인 권장)"
     else:
         result = "변경 없음"
         summary = "전일 대비 변경 감지 없음"
+    if deferred:
+        summary += f" / 시간 예산 초과로 {len(deferred)}건 다음 실행으로 보류"
+    if discovery and (discovery["new"] or discovery["withdrawn"]):
+        summary += f" / 목록 외 신규 {len(discovery['new'])}건, 폐지 추정 {len(discovery['withdrawn'])}건"
 
-    rec = {
-        "id": TODAY,
-        "date": TODAY,
+    return {
+        "id": date,
+        "date": date,
         "scope": "NFPC / NFTC TEST (법제처 OPEN API: 행정규칙)",
         "result": result,
         "summary": summary,
         "changes": changes,
         "errors": errors,
         "refs": [],
-        "meta": {
-            "mock": MOCK,
-            "standards_nfpc": STANDARDS_NFPC,
-            "standards_nftc": STANDARDS_NFTC,
+        "meta": meta,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    global CACHE_ENABLED, CACHE_REFRESH, _DEADLINE, OUTPUT_JOURNAL
+    t0 = time.perf_counter()
+    args = parse_args(argv)
+    _DEADLINE = t0 + args.budget if args.budget > 0 else None
+    if args.no_cache:
+        CACHE_ENABLED = False
+    if args.refresh:
+        CACHE_REFRESH = True
+
+    if args.merge:
+        rec = merge_shards()
+        print(f"Done (merged {rec['meta']['shards']} shards). date={rec['date']} "
+              f"changes={len(rec['changes'])} errors={len(rec['errors'])} mock={MOCK}")
+        return
+
+    if not MOCK and not LAWGO_OC:
+        # No OC and not mock -> cannot proceed, but write an error record and exit 0
+        rec = {
+            "id": TODAY,
+            "date": TODAY,
+            "scope": "NFPC / NFTC TEST",
+            "result": "오류",
+            "summary": "LAWGO_OC 미설정 (테스트는 LAWGO_MOCK=1 또는 LAWGO_OC 필요)",
+            "changes": [],
+            "errors": [{"kind": "missing_secret", "where": "runtime", "message": "LAWGO_OC empty"}],
+            "refs": [],
         }
+        append_record(rec)
+        print("Done (missing LAWGO_OC).")
+        return
+
+    shard, shards = args.shard_index, max(1, args.shard_count)
+    if not 0 <= shard < shards:
+        raise SystemExit(f"--shard-index must be in 0..{shards - 1}")
+    if shards > 1:
+        # Shards may share a workspace; keep their journals apart
+        root, ext = os.path.splitext(OUTPUT_JOURNAL)
+        OUTPUT_JOURNAL = f"{root}.shard-{shard}-of-{shards}{ext}"
+
+    nfpc, nftc, snap, jobs = load_jobs()
+    jobs = [j for j in jobs if in_shard(j[0], j[1].get("code"), shard, shards)]
+
+    registry = load(OUTPUT_REGISTRY, {})
+    discovery = None
+    journal = journal_load()
+    if not journal:
+        journal_clear()  # drop a stale journal from an earlier day
+    # Cadence tiers: standards not due today keep their snapshot entry (and its checkedAt) untouched
+    tiers = {(tab_key, item.get("code")): tier(item, prev) for tab_key, item, prev in jobs}
+    resting = set()
+    if CADENCE and not args.all:
+        resting = {(tab_key, item.get("code")) for tab_key, item, prev in jobs
+                   if not is_due(tab_key, item, prev, tiers[(tab_key, item.get("code"))])}
+
+    # Most likely to have changed first, so a budget cut drops the least urgent standards
+    pending = schedule([j for j in jobs if (j[0], j[1].get("code")) not in journal
+                        and (j[0], j[1].get("code")) not in resting])
+    resumed = sum(1 for tab_key, item, _ in jobs if (tab_key, item.get("code")) in journal)
+    try:
+        if ASYNC:
+            fresh = asyncio.run(run_checks_async(pending, registry=registry, chunk=CHECKPOINT_EVERY, checkpoint=journal_append))
+        else:
+            fresh = run_checks(pending, registry=registry, chunk=CHECKPOINT_EVERY, checkpoint=journal_append)
+        for (tab_key, item, _), cur in zip(pending, fresh):
+            journal[(tab_key, item.get("code"))] = cur
+        results = [journal.get((tab_key, item.get("code"))) or {"resting": True} for tab_key, item, _ in jobs]
+        # The catalog crawl is not partitioned: shard 0 runs it
+        if (args.discover or DISCOVER) and shard == 0 and not over_budget():
+            listed = {tab: {it.get("code") for it in std.get("items", []) if it.get("code")}
+                      for tab, std in (("nfpc", nfpc), ("nftc", nftc))}
+            discovery = discover(listed)
+    finally:
+        http = http_stats()
+        close_session()
+
+    entries, changes, errors, deferred = summarize(jobs, results)
+
+    meta = {
+        "mock": MOCK,
+        "concurrency": CONCURRENCY,
+        "transport": "async" if ASYNC else "sync",
+        "http": http,
+        "cache": cache_meta(),
+        "rateLimit": rate_meta(),
+        "breaker": breaker_meta(),
+        "coalesced": _RUN_STATS["coalesced"],
+        "resumed": resumed,
+        "registry": {"days": REGISTRY_DAYS, "reused": _RUN_STATS["registryReused"],
+                     "reresolved": _RUN_STATS["registryReresolved"]},
+        "discovery": discovery,
+        "schedule": {"budgetSeconds": args.budget, "deferred": [code for _, code in deferred]},
+        "cadence": {"enabled": CADENCE and not args.all, "resting": len(resting),
+                    "tiers": {t: sum(1 for v in tiers.values() if v == t) for t in TIER_DAYS}},
+        "incremental": {"enabled": INCREMENTAL, "detailSkipped": _RUN_STATS["detailSkipped"]},
+        "standards_nfpc": STANDARDS_NFPC,
+        "standards_nftc": STANDARDS_NFTC,
     }
 
-    data["records"] = [r for r in data.get("records", []) if r.get("date") != TODAY]
-    data["records"].insert(0, rec)
+    if shards > 1:
+        meta["perf"] = perf_report(time.perf_counter() - t0)
+        path = write_partial(shard, shards, entries, changes, errors, deferred, registry, discovery, meta)
+        journal_clear()
+        if TRACE_PATH:
+            write_trace(TRACE_PATH)
+        print(f"Done (shard {shard}/{shards} -> {path}). date={TODAY} changes={len(changes)} errors={len(errors)} mock={MOCK}")
+        return
+
+    for tab_key, code, cur in entries:
+        snap.setdefault(tab_key, {})[code] = cur
+    rec = make_record(TODAY, [c for _, c in changes], [e for _, e in errors], meta["schedule"]["deferred"], discovery, meta)
 
+    registry_prune(registry, jobs)
+    save(OUTPUT_REGISTRY, registry)
     save(OUTPUT_SNAPSHOT, snap)
-    save(OUTPUT_DATA, data)
+    # History saves themselves are only visible in the trace file
+    rec["meta"]["perf"] = perf_report(time.perf_counter() - t0)
+    append_record(rec)
+    journal_clear()
+    if TRACE_PATH:
+        write_trace(TRACE_PATH)
 
     print(f"Done. date={TODAY} changes={len(changes)} errors={len(errors)} mock={MOCK}")
 